@@ -71,6 +71,13 @@ from shared.api.models.management.responses import (  # Document Responses; Prom
     WrappedUsersResponse,
     WrappedVerificationResult,
 )
+from shared.api.models.retrieval.requests import (
+    AgentRequest,
+    CompletionRequest,
+    RAGRequest,
+    ReasoningAgentRequest,
+    SearchRequest,
+)
 from shared.api.models.retrieval.responses import (
     AgentResponse,
     Citation,
@@ -161,6 +168,12 @@ __all__ = [
     "GenericMessageResponse",
     "WrappedBooleanResponse",
     "WrappedGenericMessageResponse",
+    # Retrieval Requests
+    "SearchRequest",
+    "RAGRequest",
+    "AgentRequest",
+    "ReasoningAgentRequest",
+    "CompletionRequest",
     # TODO: This needs to be cleaned up
     "RAGResponse",
     "Citation",
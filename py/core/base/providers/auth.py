@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 from fastapi import Security, WebSocket
 from fastapi.security import (
@@ -67,6 +67,7 @@ class AuthProvider(Provider, ABC):
         super().__init__(config)
         self.config: AuthConfig = config
         self.database_provider: "PostgresDatabaseProvider" = database_provider
+        self._auth_wrappers: dict[bool, Callable[..., Awaitable[User]]] = {}
 
     async def _get_default_admin_user(self) -> User:
         return await self.database_provider.users_handler.get_user_by_email(
@@ -123,6 +124,12 @@ class AuthProvider(Provider, ABC):
         self,
         public: bool = False,
     ):
+        # FastAPI caches dependency results per request keyed on the callable,
+        # so handing out a single wrapper per flavour lets the rate limiter
+        # and the endpoint share one authentication pass.
+        if public in self._auth_wrappers:
+            return self._auth_wrappers[public]
+
         async def _auth_wrapper(
             auth: Optional[HTTPAuthorizationCredentials] = Security(
                 self.security
@@ -204,6 +211,7 @@ class AuthProvider(Provider, ABC):
                 status_code=401,
             )
 
+        self._auth_wrappers[public] = _auth_wrapper
         return _auth_wrapper
 
     def websocket_auth_wrapper(
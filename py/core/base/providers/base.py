@@ -38,6 +38,18 @@ class AppConfig(InnerConfig):
     vlm: Optional[str] = None
     audio_lm: Optional[str] = None
 
+    # Streamed RAG/agent output can be coalesced into writes of up to
+    # `stream_flush_bytes`, held back at most `stream_flush_interval_ms`.
+    # Off (0) by default: under uvicorn a streamed send costs about 3 us of
+    # CPU with httptools and 9 us with h11 and the gzip middleware, while
+    # coalescing costs about 11 us per chunk, and it delays each token by up
+    # to the interval. It only pays off where a send is much more expensive.
+    stream_flush_bytes: int = 4096
+    stream_flush_interval_ms: int = 0
+    # Chunks read from the LLM ahead of the client; a full queue pauses
+    # generation until the client catches up. 0 disables read-ahead.
+    stream_prefetch_chunks: int = 64
+
     # File extension to max-size mapping
     # These are examples; adjust sizes as needed.
     max_upload_size_by_type: dict[str, int] = {
@@ -1,10 +1,12 @@
 import functools
 import logging
 from abc import abstractmethod
-from typing import Callable
+from typing import Any, Callable
 
 from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic_core import to_json
+from starlette.types import Receive, Scope, Send
 
 from core.base import R2RException
 
@@ -14,7 +16,37 @@ from ...config import R2RConfig
 logger = logging.getLogger()
 
 
+class R2RJSONResponse(JSONResponse):
+    """JSON response rendered with pydantic-core's encoder instead of the
+    stdlib `json` module, which is noticeably faster on large payloads."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class R2RStreamingResponse(StreamingResponse):
+    """Streaming response that closes its body iterator once it is done.
+
+    Starlette stops iterating when the client disconnects but leaves the
+    generator suspended, so whatever it holds open (an LLM call, a database
+    connection) would otherwise only be released on garbage collection.
+    """
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
 class BaseRouterV3:
+    # Response class used by routes that do not set one explicitly
+    default_response_class: type[JSONResponse] = JSONResponse
+
     def __init__(
         self, providers: R2RProviders, services: R2RServices, config: R2RConfig
     ):
@@ -25,7 +57,9 @@ class BaseRouterV3:
         self.providers = providers
         self.services = services
         self.config = config
-        self.router = APIRouter()
+        self.router = APIRouter(
+            default_response_class=self.default_response_class
+        )
         self.openapi_extras = self._load_openapi_extras()
 
         # Add the rate-limiting dependency
@@ -54,7 +88,8 @@ class BaseRouterV3:
                 else:
                     results, outer_kwargs = func_result, {}
 
-                if isinstance(results, (StreamingResponse, FileResponse)):
+                # Streaming, file and pre-rendered responses go out as is
+                if isinstance(results, Response):
                     return results
                 return {"results": results, **outer_kwargs}
 
@@ -104,10 +139,10 @@ class BaseRouterV3:
             request: Request,
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ):
-            """1) Fetch the user from the DB (including .limits_overrides).
+            """1) Pass the authenticated user (including .limits_overrides)
+            to limits_handler.check_limits.
 
-            2) Pass it to limits_handler.check_limits. 3) After the endpoint
-            completes, call limits_handler.log_request.
+            2) After the endpoint completes, call limits_handler.log_request.
             """
             # If the user is superuser, skip checks
             if auth_user.is_superuser:
@@ -117,17 +152,12 @@ class BaseRouterV3:
             user_id = auth_user.id
             route = request.scope["path"]
 
-            # 1) Fetch the user from DB
-            user = await self.providers.database.users_handler.get_user_by_id(
-                user_id
-            )
-            if not user:
-                raise HTTPException(status_code=404, detail="User not found.")
-
-            # 2) Rate-limit check
+            # 1) Rate-limit check. The auth wrapper has just loaded the user
+            # row for this request, so its limits_overrides are current and
+            # there is no need to fetch the user again.
             try:
                 await self.providers.database.limits_handler.check_limits(
-                    user=user,
+                    user=auth_user,
                     route=route,  # Pass the User object
                 )
             except ValueError as e:
@@ -137,11 +167,11 @@ class BaseRouterV3:
             request.state.user_id = user_id
             request.state.route = route
 
-            # 3) Execute the route
+            # 2) Execute the route
             try:
                 yield
             finally:
-                # 4) Log only POST and DELETE requests
+                # 3) Log only POST and DELETE requests
                 if request.method in ["POST", "DELETE"]:
                     await self.providers.database.limits_handler.log_request(
                         user_id, route
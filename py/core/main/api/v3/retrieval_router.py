@@ -1,22 +1,22 @@
+import asyncio
 import logging
-import textwrap
-from typing import Any, Optional
-from uuid import UUID
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
 
-from fastapi import Body, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import Body, Depends, HTTPException
 
 from core.base import (
-    GenerationConfig,
-    Message,
     R2RException,
     SearchMode,
     SearchSettings,
     select_search_filters,
 )
 from core.base.api.models import (
+    AgentRequest,
+    CompletionRequest,
+    RAGRequest,
+    ReasoningAgentRequest,
+    SearchRequest,
     WrappedAgentResponse,
-    WrappedCompletionResponse,
     WrappedEmbeddingResponse,
     WrappedLLMChatCompletion,
     WrappedRAGResponse,
@@ -25,31 +25,632 @@ from core.base.api.models import (
 
 from ...abstractions import R2RProviders, R2RServices
 from ...config import R2RConfig
-from .base_router import BaseRouterV3
+from .base_router import BaseRouterV3, R2RJSONResponse, R2RStreamingResponse
+
+# Mode defaults are built once at import. Requests get a shallow copy: the
+# request path only reassigns top-level fields (`filters` in particular), and
+# the providers deep-copy the settings themselves before adjusting nested
+# limits, so the nested settings models can be shared with the template.
+_DEFAULT_SEARCH_SETTINGS: dict[SearchMode, SearchSettings] = {
+    mode: SearchSettings.get_default(mode.value)
+    for mode in SearchMode
+    if mode is not SearchMode.custom
+}
 
 
 def merge_search_settings(
     base: SearchSettings, overrides: SearchSettings
 ) -> SearchSettings:
-    # Convert both to dict
-    base_dict = base.model_dump()
-    overrides_dict = overrides.model_dump(exclude_unset=True)
+    if not overrides.model_fields_set:
+        return base
+
+    # Only the fields explicitly set on overrides take precedence. Both
+    # inputs are already validated, so copy the base with those fields
+    # substituted rather than dumping and re-validating the whole tree.
+    # Values are read straight from the instance dict, and model_copy writes
+    # them into the copy's __dict__ and marks them as set.
+    overrides_dict = overrides.__dict__
+    updates = {
+        field: overrides_dict[field] for field in overrides.model_fields_set
+    }
+    return base.model_copy(update=updates)
+
+
+# Ask proxies (nginx honours X-Accel-Buffering) and caches to hand streamed
+# output to the client as it is produced instead of buffering the response.
+_STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+async def coalesce_stream(
+    chunks: AsyncIterator[str],
+    flush_bytes: int,
+    flush_interval: float,
+) -> AsyncGenerator[bytes, None]:
+    """Merge small stream chunks into fewer, larger writes.
+
+    Token-by-token LLM output would otherwise cost one ASGI send per token.
+    Buffered output is flushed once it reaches `flush_bytes`, or once the
+    oldest buffered chunk has waited `flush_interval` seconds, so batching
+    never holds a token back for longer than the interval. The stream is a
+    concatenation of tagged text, so merging chunks does not change what the
+    client reads.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    # Encoded chunks are joined once per flush, since appending them to a
+    # bytearray and snapshotting it would copy every byte twice. Joining a
+    # single part returns it as is, the usual case for slow token streams.
+    parts: list[bytes] = []
+    size = 0
+    deadline = 0.0
+    # While output is buffered the next chunk is awaited through a task, so
+    # that a flush timeout does not cancel (and so close) the underlying
+    # generator. A read left pending by a flush is picked up afterwards.
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if not parts:
+                # Nothing to flush on a timer, so read without a task.
+                try:
+                    if pending is not None:
+                        chunk = await pending
+                    else:
+                        chunk = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    pending = None
+                deadline = loop.time() + flush_interval
+            else:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    yield b"".join(parts)
+                    parts.clear()
+                    size = 0
+                    continue
+                read = pending or asyncio.ensure_future(iterator.__anext__())
+                pending = read
+                await asyncio.wait((read,), timeout=timeout)
+                if not read.done():
+                    yield b"".join(parts)
+                    parts.clear()
+                    size = 0
+                    continue
+                try:
+                    chunk = await read
+                except StopAsyncIteration:
+                    break
+                except Exception:
+                    # Send what was produced before the failure, as an
+                    # unbuffered stream would have.
+                    yield b"".join(parts)
+                    raise
+                finally:
+                    pending = None
+            data = chunk.encode() if isinstance(chunk, str) else bytes(chunk)
+            parts.append(data)
+            size += len(data)
+            if size >= flush_bytes:
+                yield b"".join(parts)
+                parts.clear()
+                size = 0
+        if parts:
+            yield b"".join(parts)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            # The generator cannot be closed while the task still runs it.
+            await asyncio.wait((pending,))
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+# Marks the end of the upstream stream in the `prefetch_stream` queue.
+_STREAM_END = object()
+
+
+async def prefetch_stream(
+    chunks: AsyncIterator[Any],
+    maxsize: int,
+) -> AsyncGenerator[Any, None]:
+    """Pull from `chunks` in a background task, up to `maxsize` ahead.
+
+    The upstream LLM stream keeps producing while earlier chunks are being
+    written to the socket. Once the queue is full the producer blocks on
+    `put`, so a slow client pauses generation rather than having its answer
+    buffered in worker memory.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def produce() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception:
+            await queue.put(_STREAM_END)
+            raise
+        finally:
+            # `async for` leaves the iterator open when it is interrupted,
+            # and with it the upstream LLM request.
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put(_STREAM_END)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while (chunk := await queue.get()) is not _STREAM_END:
+            yield chunk
+        # Surfaces an upstream failure once the chunks before it are sent.
+        await producer
+    finally:
+        producer.cancel()
+        # asyncio.wait, unlike gather, does not cancel the producer a second
+        # time if this cleanup is itself cancelled, so the upstream close is
+        # never cut short.
+        await asyncio.wait((producer,))
+
+
+_SEARCH_CODE_SAMPLES = [
+    {
+        "lang": "Python",
+        "source": """
+from r2r import R2RClient
+
+client = R2RClient()
+# if using auth, do client.login(...)
+
+# Basic mode, no overrides
+response = client.retrieval.search(
+    query="Who is Aristotle?",
+    search_mode="basic"
+)
 
-    # Update base_dict with values from overrides_dict
-    # This ensures that any field set in overrides takes precedence
-    for k, v in overrides_dict.items():
-        base_dict[k] = v
+# Advanced mode with overrides
+response = client.retrieval.search(
+    query="Who is Aristotle?",
+    search_mode="advanced",
+    search_settings={
+        "filters": {"document_id": {"$eq": "3e157b3a-..."}},
+        "limit": 5
+    }
+)
 
-    # Construct a new SearchSettings from the merged dict
-    return SearchSettings(**base_dict)
+# Custom mode with full control
+response = client.retrieval.search(
+    query="Who is Aristotle?",
+    search_mode="custom",
+    search_settings={
+        "use_semantic_search": True,
+        "filters": {"category": {"$like": "%philosophy%"}},
+        "limit": 20,
+        "chunk_settings": {"index_measure": "l2_distance"}
+    }
+)
+""",
+    },
+    {
+        "lang": "JavaScript",
+        "source": """
+const { r2rClient } = require("r2r-js");
+
+const client = new r2rClient();
+
+function main() {
+    const response = await client.search({
+        query: "Who is Aristotle?",
+        search_settings: {
+            filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+            useSemanticSearch: true
+        }
+    });
+}
+
+main();
+""",
+    },
+    {
+        "lang": "Shell",
+        "source": """
+curl -X POST "https://api.example.com/retrieval/search" \\
+    -H "Content-Type: application/json" \\
+    -H "Authorization: Bearer YOUR_API_KEY" \\
+    -d '{
+    "query": "Who is Aristotle?",
+    "search_settings": {
+        filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+        use_semantic_search: true
+    }
+}'
+""",
+    },
+]
+
+_RAG_CODE_SAMPLES = [
+    {
+        "lang": "Python",
+        "source": """
+from r2r import R2RClient
+
+client = R2RClient()
+# when using auth, do client.login(...)
+
+response = client.retrieval.rag(
+    query="Who is Aristotle?",
+    search_settings={
+        "use_semantic_search": True,
+        "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+        "limit": 10,
+        "chunk_settings": {
+            "limit": 20, # separate limit for chunk vs. graph
+        },
+    },
+    rag_generation_config={
+        "stream": false,
+        "temperature": 0.7,
+        "max_tokens": 150
+    }
+)
+""",
+    },
+    {
+        "lang": "JavaScript",
+        "source": """
+const { r2rClient } = require("r2r-js");
+
+const client = new r2rClient();
+
+function main() {
+    const response = await client.retrieval.rag({
+        query: "Who is Aristotle?",
+        search_settings: {
+            filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+            useSemanticSearch: true,
+            chunkSettings: {
+                limit: 20, # separate limit for chunk vs. graph
+            },
+        },
+        ragGenerationConfig: {
+            stream: false,
+            temperature: 0.7,
+            maxTokens: 150
+        }
+    });
+}
+
+main();
+""",
+    },
+    {
+        "lang": "Shell",
+        "source": """
+curl -X POST "https://api.example.com/retrieval/rag" \\
+    -H "Content-Type: application/json" \\
+    -H "Authorization: Bearer YOUR_API_KEY" \\
+    -d '{
+    "query": "Who is Aristotle?",
+    "search_settings": {
+        "use_semantic_search": True,
+        "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+        "limit": 10,
+        chunk_settings={
+            "limit": 20, # separate limit for chunk vs. graph
+        },
+    },
+    "rag_generation_config": {
+        stream: false,
+        temperature: 0.7,
+        max_tokens: 150
+    }
+}'
+""",
+    },
+]
+
+_AGENT_CODE_SAMPLES = [
+    {
+        "lang": "Python",
+        "source": """
+from r2r import R2RClient
+
+client = R2RClient()
+# when using auth, do client.login(...)
+
+response = client.retrieval.agent(
+    message={
+        "role": "user",
+        "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
+    },
+    search_settings={
+        "use_semantic_search": True,
+        "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+        "limit": 10,
+        chunk_settings={
+            "limit": 20, # separate limit for chunk vs. graph
+        },
+        graph_settings={
+            "enabled": True,
+        },
+    },
+    rag_generation_config: {
+        stream: false,
+        temperature: 0.7,
+        max_tokens: 150
+    }
+    include_title_if_available=True,
+    conversation_id="550e8400-e29b-41d4-a716-446655440000"  # Optional for conversation continuity
+)
+""",
+    },
+    {
+        "lang": "JavaScript",
+        "source": """
+const { r2rClient } = require("r2r-js");
+
+const client = new r2rClient();
+
+function main() {
+    const response = await client.retrieval.agent({
+        message: {
+            role: "user",
+            content: "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
+        },
+        searchSettings: {
+            filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+            useSemanticSearch: true,
+            chunkSettings: {
+                limit: 20, # separate limit for chunk vs. graph
+                enabled: true
+            },
+            graphSettings: {
+                enabled: true,
+            },
+        },
+        ragGenerationConfig: {
+            stream: false,
+            temperature: 0.7,
+            maxTokens: 150
+        },
+        includeTitleIfAvailable: true,
+        conversationId: "550e8400-e29b-41d4-a716-446655440000"
+    });
+}
+
+main();
+""",
+    },
+    {
+        "lang": "Shell",
+        "source": """
+curl -X POST "https://api.example.com/retrieval/agent" \\
+    -H "Content-Type: application/json" \\
+    -H "Authorization: Bearer YOUR_API_KEY" \\
+    -d '{
+    "message": {
+        "role": "user",
+        "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
+    },
+    "search_settings": {
+        "use_semantic_search": True,
+        "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
+        "limit": 10,
+        chunk_settings={
+            "limit": 20, # separate limit for chunk vs. graph
+        },
+        graph_settings={
+            "enabled": True,
+        },
+    },
+    "include_title_if_available": true,
+    "conversation_id": "550e8400-e29b-41d4-a716-446655440000"
+    }'
+""",
+    },
+]
+
+_REASONING_AGENT_CODE_SAMPLES = [
+    {
+        "lang": "Python",
+        "source": """
+from r2r import R2RClient
+
+client = R2RClient()
+# when using auth, do client.login(...)
+
+response = client.retrieval.reasoning_agent(
+    message={
+        "role": "user",
+        "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
+    },
+    rag_generation_config: {
+        stream: false,
+        temperature: 0.7,
+        max_tokens: 150
+    }
+    conversation_id="550e8400-e29b-41d4-a716-446655440000"  # Optional for conversation continuity
+)
+""",
+    },
+    {
+        "lang": "JavaScript",
+        "source": """
+const { r2rClient } = require("r2r-js");
+
+const client = new r2rClient();
+
+function main() {
+    const response = await client.retrieval.agent({
+        message: {
+            role: "user",
+            content: "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
+        },
+        ragGenerationConfig: {
+            stream: false,
+            temperature: 0.7,
+            maxTokens: 150
+        },
+        conversationId: "550e8400-e29b-41d4-a716-446655440000"
+    });
+}
+
+main();
+""",
+    },
+    {
+        "lang": "Shell",
+        "source": """
+curl -X POST "https://api.example.com/retrieval/agent" \\
+    -H "Content-Type: application/json" \\
+    -H "Authorization: Bearer YOUR_API_KEY" \\
+    -d '{
+    "message": {
+        "role": "user",
+        "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
+    },
+    "conversation_id": "550e8400-e29b-41d4-a716-446655440000"
+    }'
+""",
+    },
+]
+
+_COMPLETION_CODE_SAMPLES = [
+    {
+        "lang": "Python",
+        "source": """
+from r2r import R2RClient
+
+client = R2RClient()
+# when using auth, do client.login(...)
+
+response = client.completion(
+    messages=[
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "What is the capital of France?"},
+        {"role": "assistant", "content": "The capital of France is Paris."},
+        {"role": "user", "content": "What about Italy?"}
+    ],
+    generation_config={
+        "model": "gpt-4o-mini",
+        "temperature": 0.7,
+        "max_tokens": 150,
+        "stream": False
+    }
+)
+""",
+    },
+    {
+        "lang": "JavaScript",
+        "source": """
+const { r2rClient } = require("r2r-js");
+
+const client = new r2rClient();
+
+function main() {
+    const response = await client.completion({
+        messages: [
+            { role: "system", content: "You are a helpful assistant." },
+            { role: "user", content: "What is the capital of France?" },
+            { role: "assistant", content: "The capital of France is Paris." },
+            { role: "user", content: "What about Italy?" }
+        ],
+        generationConfig: {
+            model: "gpt-4o-mini",
+            temperature: 0.7,
+            maxTokens: 150,
+            stream: false
+        }
+    });
+}
+
+main();
+""",
+    },
+    {
+        "lang": "Shell",
+        "source": """
+curl -X POST "https://api.example.com/retrieval/completion" \\
+    -H "Content-Type: application/json" \\
+    -H "Authorization: Bearer YOUR_API_KEY" \\
+    -d '{
+    "messages": [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "What is the capital of France?"},
+        {"role": "assistant", "content": "The capital of France is Paris."},
+        {"role": "user", "content": "What about Italy?"}
+    ],
+    "generation_config": {
+        "model": "gpt-4o-mini",
+        "temperature": 0.7,
+        "max_tokens": 150,
+        "stream": false
+    }
+    }'
+""",
+    },
+]
+
+_EMBEDDING_CODE_SAMPLES = [
+    {
+        "lang": "Python",
+        "source": """
+from r2r import R2RClient
+
+client = R2RClient()
+# when using auth, do client.login(...)
+
+result = client.retrieval.embedding(
+    text="Who is Aristotle?",
+)
+""",
+    },
+    {
+        "lang": "JavaScript",
+        "source": """
+const { r2rClient } = require("r2r-js");
+
+const client = new r2rClient();
+
+function main() {
+    const response = await client.retrieval.embedding({
+        text: "Who is Aristotle?",
+    });
+}
+
+main();
+""",
+    },
+    {
+        "lang": "Shell",
+        "source": """
+curl -X POST "https://api.example.com/retrieval/embedding" \\
+    -H "Content-Type: application/json" \\
+    -H "Authorization: Bearer YOUR_API_KEY" \\
+    -d '{
+    "text": "Who is Aristotle?",
+    }'
+""",
+    },
+]
 
 
 class RetrievalRouter(BaseRouterV3):
+    default_response_class = R2RJSONResponse
+
     def __init__(
         self, providers: R2RProviders, services: R2RServices, config: R2RConfig
     ):
         logging.info("Initializing RetrievalRouter")
         super().__init__(providers, services, config)
+        self._quality_llm = config.app.quality_llm
+        self._stream_flush_bytes = config.app.stream_flush_bytes
+        self._stream_flush_interval = (
+            config.app.stream_flush_interval_ms / 1000
+        )
+        self._stream_prefetch_chunks = config.app.stream_prefetch_chunks
 
     def _register_workflows(self):
         pass
@@ -62,133 +663,69 @@ class RetrievalRouter(BaseRouterV3):
     ) -> SearchSettings:
         """Prepare the effective search settings based on the provided
         search_mode, optional user-overrides in search_settings, and applied
-        filters."""
-        if search_mode != SearchMode.custom:
+        filters.
+
+        The result is deliberately rebuilt on every request rather than
+        memoized per user: the filters reflect the user's current collection
+        membership, which can change between requests, and a key covering
+        the user's collections costs about as much to hash as this does to
+        build. The returned settings are also mutated downstream, so a
+        cached copy would need copying out again.
+        """
+        if search_mode is not SearchMode.custom:
             # Start from mode defaults
-            effective_settings = SearchSettings.get_default(search_mode.value)
+            effective_settings = _DEFAULT_SEARCH_SETTINGS[
+                search_mode
+            ].model_copy()
             if search_settings:
                 # Merge user-provided overrides
                 effective_settings = merge_search_settings(
                     effective_settings, search_settings
                 )
         else:
-            # Custom mode: use provided settings or defaults
-            effective_settings = search_settings or SearchSettings()
+            # Custom mode: use provided settings or defaults. The defaults
+            # need no validation, so skip the validating constructor.
+            effective_settings = (
+                search_settings or SearchSettings.model_construct()
+            )
 
-        # Apply user-specific filters
+        # Apply user-specific filters. The database handlers compile these
+        # into the WHERE clause of the chunk and graph queries, so the
+        # owner/collection restriction is evaluated by Postgres together with
+        # the vector ordering rather than on the results in Python.
         effective_settings.filters = select_search_filters(
             auth_user, effective_settings
         )
         return effective_settings
 
+    def _stream_response(
+        self, response: AsyncIterator[str]
+    ) -> R2RStreamingResponse:
+        """Wrap a RAG/agent chunk stream in an event-stream response."""
+        content: AsyncIterator[Any] = response
+        # An asyncio.Queue with maxsize 0 would be unbounded.
+        if self._stream_prefetch_chunks > 0:
+            content = prefetch_stream(content, self._stream_prefetch_chunks)
+        if self._stream_flush_interval > 0:
+            content = coalesce_stream(
+                content, self._stream_flush_bytes, self._stream_flush_interval
+            )
+        return R2RStreamingResponse(
+            content,
+            media_type="text/event-stream",
+            headers=_STREAM_HEADERS,
+        )
+
     def _setup_routes(self):
         @self.router.post(
             "/retrieval/search",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="Search R2R",
-            openapi_extra={
-                "x-codeSamples": [
-                    {
-                        "lang": "Python",
-                        "source": textwrap.dedent("""
-                            from r2r import R2RClient
-
-                            client = R2RClient()
-                            # if using auth, do client.login(...)
-
-                            # Basic mode, no overrides
-                            response = client.retrieval.search(
-                                query="Who is Aristotle?",
-                                search_mode="basic"
-                            )
-
-                            # Advanced mode with overrides
-                            response = client.retrieval.search(
-                                query="Who is Aristotle?",
-                                search_mode="advanced",
-                                search_settings={
-                                    "filters": {"document_id": {"$eq": "3e157b3a-..."}},
-                                    "limit": 5
-                                }
-                            )
-
-                            # Custom mode with full control
-                            response = client.retrieval.search(
-                                query="Who is Aristotle?",
-                                search_mode="custom",
-                                search_settings={
-                                    "use_semantic_search": True,
-                                    "filters": {"category": {"$like": "%philosophy%"}},
-                                    "limit": 20,
-                                    "chunk_settings": {"index_measure": "l2_distance"}
-                                }
-                            )
-                            """),
-                    },
-                    {
-                        "lang": "JavaScript",
-                        "source": textwrap.dedent("""
-                            const { r2rClient } = require("r2r-js");
-
-                            const client = new r2rClient();
-
-                            function main() {
-                                const response = await client.search({
-                                    query: "Who is Aristotle?",
-                                    search_settings: {
-                                        filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                        useSemanticSearch: true
-                                    }
-                                });
-                            }
-
-                            main();
-                            """),
-                    },
-                    {
-                        "lang": "Shell",
-                        "source": textwrap.dedent("""
-                            curl -X POST "https://api.example.com/retrieval/search" \\
-                                -H "Content-Type: application/json" \\
-                                -H "Authorization: Bearer YOUR_API_KEY" \\
-                                -d '{
-                                "query": "Who is Aristotle?",
-                                "search_settings": {
-                                    filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                    use_semantic_search: true
-                                }
-                            }'
-                            """),
-                    },
-                ]
-            },
+            openapi_extra={"x-codeSamples": _SEARCH_CODE_SAMPLES},
         )
         @self.base_endpoint
         async def search_app(
-            query: str = Body(
-                ...,
-                description="Search query to find relevant documents",
-            ),
-            search_mode: SearchMode = Body(
-                default=SearchMode.custom,
-                description=(
-                    "Default value of `custom` allows full control over search settings.\n\n"
-                    "Pre-configured search modes:\n"
-                    "`basic`: A simple semantic-based search.\n"
-                    "`advanced`: A more powerful hybrid search combining semantic and full-text.\n"
-                    "`custom`: Full control via `search_settings`.\n\n"
-                    "If `filters` or `limit` are provided alongside `basic` or `advanced`, "
-                    "they will override the default settings for that mode."
-                ),
-            ),
-            search_settings: Optional[SearchSettings] = Body(
-                None,
-                description=(
-                    "The search configuration object. If `search_mode` is `custom`, "
-                    "these settings are used as-is. For `basic` or `advanced`, these settings will override the default mode configuration.\n\n"
-                    "Common overrides include `filters` to narrow results and `limit` to control how many results are returned."
-                ),
-            ),
+            search_request: SearchRequest,
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedSearchResponse:
             """Perform a search query against vector and/or graph-based
@@ -224,139 +761,28 @@ class RetrievalRouter(BaseRouterV3):
             - Using `custom` mode:
             Provide the entire `search_settings` to define your search exactly as you want it.
             """
-            if query == "":
-                raise R2RException("Query cannot be empty", 400)
             effective_settings = self._prepare_search_settings(
-                auth_user, search_mode, search_settings
+                auth_user,
+                search_request.search_mode,
+                search_request.search_settings,
             )
             results = await self.services.retrieval.search(
-                query=query,
+                query=search_request.query,
                 search_settings=effective_settings,
             )
-            return results
+            # Validate once and encode the model straight to JSON, instead of
+            # FastAPI validating, dumping to a dict and then encoding that.
+            return R2RJSONResponse(WrappedSearchResponse(results=results))  # type: ignore
 
         @self.router.post(
             "/retrieval/rag",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="RAG Query",
-            openapi_extra={
-                "x-codeSamples": [
-                    {
-                        "lang": "Python",
-                        "source": textwrap.dedent("""
-                            from r2r import R2RClient
-
-                            client = R2RClient()
-                            # when using auth, do client.login(...)
-
-                            response = client.retrieval.rag(
-                                query="Who is Aristotle?",
-                                search_settings={
-                                    "use_semantic_search": True,
-                                    "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                    "limit": 10,
-                                    "chunk_settings": {
-                                        "limit": 20, # separate limit for chunk vs. graph
-                                    },
-                                },
-                                rag_generation_config={
-                                    "stream": false,
-                                    "temperature": 0.7,
-                                    "max_tokens": 150
-                                }
-                            )
-                            """),
-                    },
-                    {
-                        "lang": "JavaScript",
-                        "source": textwrap.dedent("""
-                            const { r2rClient } = require("r2r-js");
-
-                            const client = new r2rClient();
-
-                            function main() {
-                                const response = await client.retrieval.rag({
-                                    query: "Who is Aristotle?",
-                                    search_settings: {
-                                        filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                        useSemanticSearch: true,
-                                        chunkSettings: {
-                                            limit: 20, # separate limit for chunk vs. graph
-                                        },
-                                    },
-                                    ragGenerationConfig: {
-                                        stream: false,
-                                        temperature: 0.7,
-                                        maxTokens: 150
-                                    }
-                                });
-                            }
-
-                            main();
-                            """),
-                    },
-                    {
-                        "lang": "Shell",
-                        "source": textwrap.dedent("""
-                            curl -X POST "https://api.example.com/retrieval/rag" \\
-                                -H "Content-Type: application/json" \\
-                                -H "Authorization: Bearer YOUR_API_KEY" \\
-                                -d '{
-                                "query": "Who is Aristotle?",
-                                "search_settings": {
-                                    "use_semantic_search": True,
-                                    "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                    "limit": 10,
-                                    chunk_settings={
-                                        "limit": 20, # separate limit for chunk vs. graph
-                                    },
-                                },
-                                "rag_generation_config": {
-                                    stream: false,
-                                    temperature: 0.7,
-                                    max_tokens: 150
-                                }
-                            }'
-                            """),
-                    },
-                ]
-            },
+            openapi_extra={"x-codeSamples": _RAG_CODE_SAMPLES},
         )
         @self.base_endpoint
         async def rag_app(
-            query: str = Body(...),
-            search_mode: SearchMode = Body(
-                default=SearchMode.custom,
-                description=(
-                    "Default value of `custom` allows full control over search settings.\n\n"
-                    "Pre-configured search modes:\n"
-                    "`basic`: A simple semantic-based search.\n"
-                    "`advanced`: A more powerful hybrid search combining semantic and full-text.\n"
-                    "`custom`: Full control via `search_settings`.\n\n"
-                    "If `filters` or `limit` are provided alongside `basic` or `advanced`, "
-                    "they will override the default settings for that mode."
-                ),
-            ),
-            search_settings: Optional[SearchSettings] = Body(
-                None,
-                description=(
-                    "The search configuration object. If `search_mode` is `custom`, "
-                    "these settings are used as-is. For `basic` or `advanced`, these settings will override the default mode configuration.\n\n"
-                    "Common overrides include `filters` to narrow results and `limit` to control how many results are returned."
-                ),
-            ),
-            rag_generation_config: GenerationConfig = Body(
-                default_factory=GenerationConfig,
-                description="Configuration for RAG generation",
-            ),
-            task_prompt_override: Optional[str] = Body(
-                default=None,
-                description="Optional custom prompt to override default",
-            ),
-            include_title_if_available: bool = Body(
-                default=False,
-                description="Include document titles in responses when available",
-            ),
+            rag_request: RAGRequest,
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedRAGResponse:
             """Execute a RAG (Retrieval-Augmented Generation) query.
@@ -368,207 +794,38 @@ class RetrievalRouter(BaseRouterV3):
             The generation process can be customized using the `rag_generation_config` parameter.
             """
 
-            if "model" not in rag_generation_config.__fields_set__:
-                rag_generation_config.model = self.config.app.quality_llm
+            rag_generation_config = rag_request.rag_generation_config
+            if "model" not in rag_generation_config.model_fields_set:
+                rag_generation_config.model = self._quality_llm
 
             effective_settings = self._prepare_search_settings(
-                auth_user, search_mode, search_settings
+                auth_user, rag_request.search_mode, rag_request.search_settings
             )
 
             response = await self.services.retrieval.rag(
-                query=query,
+                query=rag_request.query,
                 search_settings=effective_settings,
                 rag_generation_config=rag_generation_config,
-                task_prompt_override=task_prompt_override,
-                include_title_if_available=include_title_if_available,
+                task_prompt_override=rag_request.task_prompt_override,
+                include_title_if_available=rag_request.include_title_if_available,
             )
 
             if rag_generation_config.stream:
-
-                async def stream_generator():
-                    try:
-                        async for chunk in response:
-                            if len(chunk) > 1024:
-                                for i in range(0, len(chunk), 1024):
-                                    yield chunk[i : i + 1024]
-                            else:
-                                yield chunk
-                    except GeneratorExit:
-                        # Clean up if needed, then return
-                        return
-
-                return StreamingResponse(
-                    stream_generator(), media_type="text/event-stream"
-                )  # type: ignore
+                return self._stream_response(response)  # type: ignore
             else:
-                return response
+                return R2RJSONResponse(WrappedRAGResponse(results=response))  # type: ignore
 
         @self.router.post(
             "/retrieval/agent",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="RAG-powered Conversational Agent",
-            openapi_extra={
-                "x-codeSamples": [
-                    {
-                        "lang": "Python",
-                        "source": textwrap.dedent("""
-                        from r2r import R2RClient
-
-                        client = R2RClient()
-                        # when using auth, do client.login(...)
-
-                        response = client.retrieval.agent(
-                            message={
-                                "role": "user",
-                                "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
-                            },
-                            search_settings={
-                                "use_semantic_search": True,
-                                "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                "limit": 10,
-                                chunk_settings={
-                                    "limit": 20, # separate limit for chunk vs. graph
-                                },
-                                graph_settings={
-                                    "enabled": True,
-                                },
-                            },
-                            rag_generation_config: {
-                                stream: false,
-                                temperature: 0.7,
-                                max_tokens: 150
-                            }
-                            include_title_if_available=True,
-                            conversation_id="550e8400-e29b-41d4-a716-446655440000"  # Optional for conversation continuity
-                        )
-                        """),
-                    },
-                    {
-                        "lang": "JavaScript",
-                        "source": textwrap.dedent("""
-                            const { r2rClient } = require("r2r-js");
-
-                            const client = new r2rClient();
-
-                            function main() {
-                                const response = await client.retrieval.agent({
-                                    message: {
-                                        role: "user",
-                                        content: "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
-                                    },
-                                    searchSettings: {
-                                        filters: {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                        useSemanticSearch: true,
-                                        chunkSettings: {
-                                            limit: 20, # separate limit for chunk vs. graph
-                                            enabled: true
-                                        },
-                                        graphSettings: {
-                                            enabled: true,
-                                        },
-                                    },
-                                    ragGenerationConfig: {
-                                        stream: false,
-                                        temperature: 0.7,
-                                        maxTokens: 150
-                                    },
-                                    includeTitleIfAvailable: true,
-                                    conversationId: "550e8400-e29b-41d4-a716-446655440000"
-                                });
-                            }
-
-                            main();
-                            """),
-                    },
-                    {
-                        "lang": "Shell",
-                        "source": textwrap.dedent("""
-                            curl -X POST "https://api.example.com/retrieval/agent" \\
-                                -H "Content-Type: application/json" \\
-                                -H "Authorization: Bearer YOUR_API_KEY" \\
-                                -d '{
-                                "message": {
-                                    "role": "user",
-                                    "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
-                                },
-                                "search_settings": {
-                                    "use_semantic_search": True,
-                                    "filters": {"document_id": {"$eq": "3e157b3a-8469-51db-90d9-52e7d896b49b"}},
-                                    "limit": 10,
-                                    chunk_settings={
-                                        "limit": 20, # separate limit for chunk vs. graph
-                                    },
-                                    graph_settings={
-                                        "enabled": True,
-                                    },
-                                },
-                                "include_title_if_available": true,
-                                "conversation_id": "550e8400-e29b-41d4-a716-446655440000"
-                                }'
-                            """),
-                    },
-                ]
-            },
+            openapi_extra={"x-codeSamples": _AGENT_CODE_SAMPLES},
         )
         @self.base_endpoint
         async def agent_app(
-            message: Optional[Message] = Body(
-                None,
-                description="Current message to process",
-            ),
-            messages: Optional[list[Message]] = Body(
-                None,
-                deprecated=True,
-                description="List of messages (deprecated, use message instead)",
-            ),
-            search_mode: SearchMode = Body(
-                default=SearchMode.custom,
-                description=(
-                    "Default value of `custom` allows full control over search settings.\n\n"
-                    "Pre-configured search modes:\n"
-                    "`basic`: A simple semantic-based search.\n"
-                    "`advanced`: A more powerful hybrid search combining semantic and full-text.\n"
-                    "`custom`: Full control via `search_settings`.\n\n"
-                    "If `filters` or `limit` are provided alongside `basic` or `advanced`, "
-                    "they will override the default settings for that mode."
-                ),
-            ),
-            search_settings: Optional[SearchSettings] = Body(
-                None,
-                description=(
-                    "The search configuration object. If `search_mode` is `custom`, "
-                    "these settings are used as-is. For `basic` or `advanced`, these settings will override the default mode configuration.\n\n"
-                    "Common overrides include `filters` to narrow results and `limit` to control how many results are returned."
-                ),
-            ),
-            rag_generation_config: GenerationConfig = Body(
-                default_factory=GenerationConfig,
-                description="Configuration for RAG generation",
-            ),
-            task_prompt_override: Optional[str] = Body(
-                default=None,
-                description="Optional custom prompt to override default",
-            ),
-            include_title_if_available: bool = Body(
-                default=True,
-                description="Include document titles in responses when available",
-            ),
-            conversation_id: Optional[UUID] = Body(
-                default=None,
-                description="ID of the conversation",
-            ),
-            tools: Optional[list[str]] = Body(
-                None,
-                description="List of tools to execute",
-            ),
-            max_tool_context_length: Optional[int] = Body(
-                default=32_768,
-                description="Maximum length of returned tool context",
-            ),
-            use_system_context: Optional[bool] = Body(
-                default=True,
-                description="Use extended prompt for generation",
-            ),
+            # Every field has a default, so an empty body still reaches the
+            # service, as it did when the fields were separate Body params.
+            agent_request: AgentRequest = Body(default_factory=AgentRequest),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedAgentResponse:
             """Engage with an intelligent RAG-powered conversational agent for
@@ -602,48 +859,40 @@ class RetrievalRouter(BaseRouterV3):
             The agent uses both vector search and knowledge graph capabilities to find and synthesize
             information, providing detailed, factual responses with proper attribution to source documents.
             """
-            if "model" not in rag_generation_config.__fields_set__:
-                rag_generation_config.model = self.config.app.quality_llm
+            rag_generation_config = agent_request.rag_generation_config
+            if "model" not in rag_generation_config.model_fields_set:
+                rag_generation_config.model = self._quality_llm
 
             effective_settings = self._prepare_search_settings(
-                auth_user, search_mode, search_settings
+                auth_user,
+                agent_request.search_mode,
+                agent_request.search_settings,
             )
 
             try:
                 response = await self.services.retrieval.agent(
-                    message=message,
-                    messages=messages,
+                    message=agent_request.message,
+                    messages=agent_request.messages,
                     search_settings=effective_settings,
                     rag_generation_config=rag_generation_config,
-                    task_prompt_override=task_prompt_override,
-                    include_title_if_available=include_title_if_available,
-                    max_tool_context_length=max_tool_context_length,
-                    conversation_id=(
-                        str(conversation_id) if conversation_id else None
-                    ),
-                    use_system_context=use_system_context,
-                    override_tools=tools,
+                    task_prompt_override=agent_request.task_prompt_override,
+                    include_title_if_available=agent_request.include_title_if_available,
+                    max_tool_context_length=agent_request.max_tool_context_length,
+                    conversation_id=agent_request.conversation_id,
+                    use_system_context=agent_request.use_system_context,
+                    override_tools=agent_request.tools,
                 )
 
                 if rag_generation_config.stream:
-
-                    async def stream_generator():
-                        try:
-                            async for chunk in response:
-                                if len(chunk) > 1024:
-                                    for i in range(0, len(chunk), 1024):
-                                        yield chunk[i : i + 1024]
-                                else:
-                                    yield chunk
-                        except GeneratorExit:
-                            # Clean up if needed, then return
-                            return
-
-                    return StreamingResponse(
-                        stream_generator(), media_type="text/event-stream"
-                    )  # type: ignore
+                    return self._stream_response(response)  # type: ignore
                 else:
-                    return response
+                    return R2RJSONResponse(
+                        WrappedAgentResponse(results=response)
+                    )  # type: ignore
+            except (R2RException, HTTPException):
+                # Keep the status the service chose (400 for a bad message
+                # payload, 502 for an unreachable LLM, ...).
+                raise
             except Exception as e:
                 raise R2RException(str(e), 500) from e
 
@@ -651,94 +900,13 @@ class RetrievalRouter(BaseRouterV3):
             "/retrieval/reasoning_agent",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="Reasoning Agent with RAG(Thoughts + Tools)",
-            openapi_extra={
-                "x-codeSamples": [
-                    {
-                        "lang": "Python",
-                        "source": textwrap.dedent("""
-                        from r2r import R2RClient
-
-                        client = R2RClient()
-                        # when using auth, do client.login(...)
-
-                        response = client.retrieval.reasoning_agent(
-                            message={
-                                "role": "user",
-                                "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
-                            },
-                            rag_generation_config: {
-                                stream: false,
-                                temperature: 0.7,
-                                max_tokens: 150
-                            }
-                            conversation_id="550e8400-e29b-41d4-a716-446655440000"  # Optional for conversation continuity
-                        )
-                        """),
-                    },
-                    {
-                        "lang": "JavaScript",
-                        "source": textwrap.dedent("""
-                            const { r2rClient } = require("r2r-js");
-
-                            const client = new r2rClient();
-
-                            function main() {
-                                const response = await client.retrieval.agent({
-                                    message: {
-                                        role: "user",
-                                        content: "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
-                                    },
-                                    ragGenerationConfig: {
-                                        stream: false,
-                                        temperature: 0.7,
-                                        maxTokens: 150
-                                    },
-                                    conversationId: "550e8400-e29b-41d4-a716-446655440000"
-                                });
-                            }
-
-                            main();
-                            """),
-                    },
-                    {
-                        "lang": "Shell",
-                        "source": textwrap.dedent("""
-                            curl -X POST "https://api.example.com/retrieval/agent" \\
-                                -H "Content-Type: application/json" \\
-                                -H "Authorization: Bearer YOUR_API_KEY" \\
-                                -d '{
-                                "message": {
-                                    "role": "user",
-                                    "content": "What were the key contributions of Aristotle to logic and how did they influence later philosophers?"
-                                },
-                                "conversation_id": "550e8400-e29b-41d4-a716-446655440000"
-                                }'
-                            """),
-                    },
-                ]
-            },
+            openapi_extra={"x-codeSamples": _REASONING_AGENT_CODE_SAMPLES},
         )
         @self.base_endpoint
         async def reasoning_agent_app(
-            message: Optional[Message] = Body(
-                None,
-                description="Current message to process",
-            ),
-            rag_generation_config: GenerationConfig = Body(
-                default_factory=GenerationConfig,
-                description="Configuration for RAG generation",
-            ),
-            conversation_id: Optional[UUID] = Body(
-                default=None,
-                description="ID of the conversation",
-            ),
-            tools: Optional[list[str]] = Body(
-                None,
-                description="List of tools to execute",
-            ),
-            max_tool_context_length: Optional[int] = Body(
-                default=32_768,
-                description="Maximum length of returned tool context",
+            # As with the agent route, an empty body still reaches the service.
+            reasoning_request: ReasoningAgentRequest = Body(
+                default_factory=ReasoningAgentRequest
             ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedAgentResponse:
@@ -777,45 +945,30 @@ class RetrievalRouter(BaseRouterV3):
                 auth_user, SearchMode.basic, None
             )
 
-            if "model" not in rag_generation_config.__fields_set__:
-                rag_generation_config.model = self.config.app.quality_llm
+            rag_generation_config = reasoning_request.rag_generation_config
+            if "model" not in rag_generation_config.model_fields_set:
+                rag_generation_config.model = self._quality_llm
 
             try:
                 response = await self.services.retrieval.agent(
-                    message=message,
+                    message=reasoning_request.message,
                     messages=None,
                     search_settings=effective_settings,
                     rag_generation_config=rag_generation_config,
                     task_prompt_override=None,
                     include_title_if_available=False,
-                    max_tool_context_length=max_tool_context_length,
-                    conversation_id=(
-                        str(conversation_id) if conversation_id else None
-                    ),
+                    max_tool_context_length=reasoning_request.max_tool_context_length,
+                    conversation_id=reasoning_request.conversation_id,
                     use_system_context=False,
-                    override_tools=tools,
+                    override_tools=reasoning_request.tools,
                     reasoning_agent=True,
                 )
 
-                if rag_generation_config.stream:
-
-                    async def stream_generator():
-                        try:
-                            async for chunk in response:
-                                if len(chunk) > 1024:
-                                    for i in range(0, len(chunk), 1024):
-                                        yield chunk[i : i + 1024]
-                                else:
-                                    yield chunk
-                        except GeneratorExit:
-                            # Clean up if needed, then return
-                            return
-
-                    return StreamingResponse(
-                        stream_generator(), media_type="text/event-stream"
-                    )  # type: ignore
-                else:
-                    return response
+                # The service rejects stream=False for the reasoning agent
+                # before doing any work, so the result is always a stream.
+                return self._stream_response(response)  # type: ignore
+            except (R2RException, HTTPException):
+                raise
             except Exception as e:
                 raise R2RException(str(e), 500) from e
 
@@ -823,117 +976,12 @@ class RetrievalRouter(BaseRouterV3):
             "/retrieval/completion",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="Generate Message Completions",
-            openapi_extra={
-                "x-codeSamples": [
-                    {
-                        "lang": "Python",
-                        "source": textwrap.dedent("""
-                            from r2r import R2RClient
-
-                            client = R2RClient()
-                            # when using auth, do client.login(...)
-
-                            response = client.completion(
-                                messages=[
-                                    {"role": "system", "content": "You are a helpful assistant."},
-                                    {"role": "user", "content": "What is the capital of France?"},
-                                    {"role": "assistant", "content": "The capital of France is Paris."},
-                                    {"role": "user", "content": "What about Italy?"}
-                                ],
-                                generation_config={
-                                    "model": "gpt-4o-mini",
-                                    "temperature": 0.7,
-                                    "max_tokens": 150,
-                                    "stream": False
-                                }
-                            )
-                            """),
-                    },
-                    {
-                        "lang": "JavaScript",
-                        "source": textwrap.dedent("""
-                            const { r2rClient } = require("r2r-js");
-
-                            const client = new r2rClient();
-
-                            function main() {
-                                const response = await client.completion({
-                                    messages: [
-                                        { role: "system", content: "You are a helpful assistant." },
-                                        { role: "user", content: "What is the capital of France?" },
-                                        { role: "assistant", content: "The capital of France is Paris." },
-                                        { role: "user", content: "What about Italy?" }
-                                    ],
-                                    generationConfig: {
-                                        model: "gpt-4o-mini",
-                                        temperature: 0.7,
-                                        maxTokens: 150,
-                                        stream: false
-                                    }
-                                });
-                            }
-
-                            main();
-                            """),
-                    },
-                    {
-                        "lang": "Shell",
-                        "source": textwrap.dedent("""
-                            curl -X POST "https://api.example.com/retrieval/completion" \\
-                                -H "Content-Type: application/json" \\
-                                -H "Authorization: Bearer YOUR_API_KEY" \\
-                                -d '{
-                                "messages": [
-                                    {"role": "system", "content": "You are a helpful assistant."},
-                                    {"role": "user", "content": "What is the capital of France?"},
-                                    {"role": "assistant", "content": "The capital of France is Paris."},
-                                    {"role": "user", "content": "What about Italy?"}
-                                ],
-                                "generation_config": {
-                                    "model": "gpt-4o-mini",
-                                    "temperature": 0.7,
-                                    "max_tokens": 150,
-                                    "stream": false
-                                }
-                                }'
-                            """),
-                    },
-                ]
-            },
+            openapi_extra={"x-codeSamples": _COMPLETION_CODE_SAMPLES},
         )
         @self.base_endpoint
         async def completion(
-            messages: list[Message] = Body(
-                ...,
-                description="List of messages to generate completion for",
-                example=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant.",
-                    },
-                    {
-                        "role": "user",
-                        "content": "What is the capital of France?",
-                    },
-                    {
-                        "role": "assistant",
-                        "content": "The capital of France is Paris.",
-                    },
-                    {"role": "user", "content": "What about Italy?"},
-                ],
-            ),
-            generation_config: GenerationConfig = Body(
-                default_factory=GenerationConfig,
-                description="Configuration for text generation",
-                example={
-                    "model": "gpt-4o-mini",
-                    "temperature": 0.7,
-                    "max_tokens": 150,
-                    "stream": False,
-                },
-            ),
+            completion_request: CompletionRequest,
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-            response_model=WrappedCompletionResponse,
         ) -> WrappedLLMChatCompletion:
             """Generate completions for a list of messages.
 
@@ -947,58 +995,15 @@ class RetrievalRouter(BaseRouterV3):
             """
 
             return await self.services.retrieval.completion(
-                messages=messages,
-                generation_config=generation_config,
+                messages=completion_request.messages,
+                generation_config=completion_request.generation_config,
             )
 
         @self.router.post(
             "/retrieval/embedding",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="Generate Embeddings",
-            openapi_extra={
-                "x-codeSamples": [
-                    {
-                        "lang": "Python",
-                        "source": textwrap.dedent("""
-                            from r2r import R2RClient
-
-                            client = R2RClient()
-                            # when using auth, do client.login(...)
-
-                            result = client.retrieval.embedding(
-                                text="Who is Aristotle?",
-                            )
-                            """),
-                    },
-                    {
-                        "lang": "JavaScript",
-                        "source": textwrap.dedent("""
-                            const { r2rClient } = require("r2r-js");
-
-                            const client = new r2rClient();
-
-                            function main() {
-                                const response = await client.retrieval.embedding({
-                                    text: "Who is Aristotle?",
-                                });
-                            }
-
-                            main();
-                            """),
-                    },
-                    {
-                        "lang": "Shell",
-                        "source": textwrap.dedent("""
-                            curl -X POST "https://api.example.com/retrieval/embedding" \\
-                                -H "Content-Type: application/json" \\
-                                -H "Authorization: Bearer YOUR_API_KEY" \\
-                                -d '{
-                                "text": "Who is Aristotle?",
-                                }'
-                            """),
-                    },
-                ]
-            },
+            openapi_extra={"x-codeSamples": _EMBEDDING_CODE_SAMPLES},
         )
         @self.base_endpoint
         async def embedding(
@@ -23,6 +23,7 @@ from .api.v3.retrieval_router import RetrievalRouter
 from .api.v3.system_router import SystemRouter
 from .api.v3.users_router import UsersRouter
 from .config import R2RConfig
+from .middleware import EventStreamAwareGZipMiddleware
 
 
 class R2RApp:
@@ -76,6 +77,7 @@ class R2RApp:
 
         self._setup_routes()
         self._apply_cors()
+        self._apply_compression()
 
     def _setup_routes(self):
         self.app.include_router(self.chunks_router, prefix="/v3")
@@ -108,6 +110,11 @@ class R2RApp:
             allow_headers=["*"],
         )
 
+    def _apply_compression(self):
+        self.app.add_middleware(
+            EventStreamAwareGZipMiddleware, minimum_size=1024
+        )
+
     async def serve(self, host: str = "0.0.0.0", port: int = 7272):
         import uvicorn
 
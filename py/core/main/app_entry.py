@@ -12,6 +12,7 @@ from core.base import R2RException
 from core.utils.logging_config import configure_logging
 
 from .assembly import R2RBuilder, R2RConfig
+from .middleware import EventStreamAwareGZipMiddleware
 
 log_file = configure_logging()
 
@@ -120,3 +121,6 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+
+# Compress large JSON responses; event streams are passed through as is
+app.add_middleware(EventStreamAwareGZipMiddleware, minimum_size=1024)
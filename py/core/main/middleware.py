@@ -0,0 +1,40 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+
+class _EventStreamGZipResponder(GZipResponder):
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get(
+                "content-type", ""
+            )
+            if content_type.startswith("text/event-stream"):
+                # Handle the stream like an already-encoded body so each
+                # chunk is forwarded as is. Gzip would hold tokens back in
+                # its compression buffer until enough output accumulates.
+                self.content_encoding_set = True
+
+
+class EventStreamAwareGZipMiddleware(GZipMiddleware):
+    """Gzip responses for clients that accept it, except for event streams.
+
+    Search and RAG responses carry chunk text and compress well, while
+    streamed RAG/agent output has to reach the client token by token.
+    """
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = _EventStreamGZipResponder(
+                    self.app,
+                    self.minimum_size,
+                    compresslevel=self.compresslevel,
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -1,11 +1,12 @@
 import asyncio
+import hashlib
 import json
 import logging
 import time
 import uuid
 from copy import deepcopy
-from datetime import datetime
-from typing import Any, Optional, cast
+from datetime import datetime, timedelta
+from typing import Any, Callable, Coroutine, Hashable, Optional, cast
 from uuid import UUID
 
 import tiktoken
@@ -44,6 +45,7 @@ from core.base import (
 )
 from core.base.api.models import RAGResponse, User
 from core.telemetry.telemetry_decorator import telemetry_event
+from core.utils.cache import Cache
 from shared.api.models.management.responses import MessageResponse
 
 from ..abstractions import R2RProviders
@@ -138,6 +140,31 @@ def num_tokens_from_messages(messages, model="gpt-4o"):
     return tokens
 
 
+class _SearchKey:
+    """Single-flight key for a search.
+
+    Hashes on the query alone, so a search with no identical query in
+    flight costs one string hash. The settings are only compared when the
+    query matches.
+    """
+
+    __slots__ = ("query", "settings")
+
+    def __init__(self, query: str, settings: SearchSettings):
+        self.query = query
+        self.settings = settings
+
+    def __hash__(self) -> int:
+        return hash(self.query)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _SearchKey)
+            and self.query == other.query
+            and self.settings == other.settings
+        )
+
+
 class RetrievalService(Service):
     def __init__(
         self,
@@ -148,6 +175,43 @@ class RetrievalService(Service):
             config,
             providers,
         )
+        self._inflight_searches: dict[
+            _SearchKey, asyncio.Task[dict[str, Any]]
+        ] = {}
+        self._inflight_embeddings: dict[str, asyncio.Task[list[float]]] = {}
+        self._inflight_completions: dict[str, asyncio.Task[Any]] = {}
+        # A 1536-dim vector is ~50 KB as a list of floats, so this holds
+        # roughly 100 MB at capacity.
+        self._embedding_cache = Cache[list[float]](
+            ttl=timedelta(hours=24), max_size=2048
+        )
+        self._completion_cache = Cache[Any](
+            ttl=timedelta(hours=1), max_size=1024
+        )
+
+    async def _single_flight(
+        self,
+        inflight: dict[Any, asyncio.Task],
+        key: Hashable,
+        run: Callable[[], Coroutine[Any, Any, Any]],
+        copy_result: bool = False,
+    ) -> Any:
+        """Await `run()`, sharing one call between concurrent callers that
+        pass the same key.
+
+        With `copy_result`, every caller gets its own deep copy of the
+        result, for results the caller may mutate. The shared result itself
+        is never handed out, so no caller sees another's changes.
+        """
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(run())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so a disconnecting caller does not cancel the call for
+        # everyone else waiting on it.
+        result = await asyncio.shield(task)
+        return deepcopy(result) if copy_result else result
 
     @telemetry_event("Search")
     async def search(
@@ -161,8 +225,23 @@ class RetrievalService(Service):
         method.
 
         Does parallel vector + graph search, returning an aggregated result.
+
+        Concurrent calls with the same query and settings share one in-flight
+        search. The settings carry the caller's access filters, so requests
+        are only coalesced within the same access scope.
         """
+        return await self._single_flight(
+            self._inflight_searches,
+            _SearchKey(query, search_settings),
+            lambda: self._search(query, search_settings),
+            copy_result=True,
+        )
 
+    async def _search(
+        self,
+        query: str,
+        search_settings: SearchSettings,
+    ) -> dict[str, Any]:
         # 1) Start run manager / telemetry
         t0 = time.time()
 
@@ -485,11 +564,50 @@ class RetrievalService(Service):
         *args,
         **kwargs,
     ):
-        return await self.providers.llm.aget_completion(
-            [message.to_dict() for message in messages],
-            generation_config,
-            *args,
-            **kwargs,
+        message_dicts = [message.to_dict() for message in messages]
+
+        # Only deterministic (temperature 0), non-streaming completions are
+        # cached; anything else is expected to vary between calls.
+        cache_key = None
+        if (
+            generation_config.temperature == 0
+            and not generation_config.stream
+            and not args
+            and not kwargs
+        ):
+            payload = json.dumps(
+                [
+                    message_dicts,
+                    generation_config.model_dump(exclude={"stream"}),
+                ],
+                sort_keys=True,
+                default=str,
+            )
+            cache_key = hashlib.blake2b(
+                payload.encode(), digest_size=16
+            ).hexdigest()
+            if (cached := self._completion_cache.get(cache_key)) is not None:
+                return cached
+
+        if cache_key is None:
+            return await self.providers.llm.aget_completion(
+                message_dicts,
+                generation_config,
+                *args,
+                **kwargs,
+            )
+
+        async def complete() -> Any:
+            response = await self.providers.llm.aget_completion(
+                message_dicts, generation_config
+            )
+            self._completion_cache.set(cache_key, response)
+            return response
+
+        # Identical deterministic requests arriving before the first one
+        # is cached share its LLM call.
+        return await self._single_flight(
+            self._inflight_completions, cache_key, complete
         )
 
     @telemetry_event("Embedding")
@@ -497,9 +615,27 @@ class RetrievalService(Service):
         self,
         text: str,
     ):
-        return await self.providers.completion_embedding.async_get_embedding(
-            text=text
+        # An embedding is a pure function of the model and the exact input
+        # text, so repeated texts are answered from memory. The text is not
+        # normalized: casing and whitespace change the vector.
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        key = (
+            f"{self.providers.completion_embedding.config.base_model}:{digest}"
         )
+        if (cached := self._embedding_cache.get(key)) is not None:
+            return cached
+
+        async def embed() -> list[float]:
+            embedding = (
+                await self.providers.completion_embedding.async_get_embedding(
+                    text=text
+                )
+            )
+            self._embedding_cache.set(key, embedding)
+            return embedding
+
+        # Concurrent misses for the same text share one provider call.
+        return await self._single_flight(self._inflight_embeddings, key, embed)
 
     @telemetry_event("RAG")
     async def rag(
@@ -1056,6 +1192,9 @@ class RetrievalService(Service):
                 ),  # Ensure it's a string
             }
 
+        except R2RException:
+            # Invalid requests keep the 4xx status they were raised with.
+            raise
         except Exception as e:
             logger.error(f"Error in agent response: {str(e)}")
             if "NoneType" in str(e):
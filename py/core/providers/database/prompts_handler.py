@@ -2,113 +2,19 @@ import json
 import logging
 import os
 from abc import abstractmethod
-from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Optional
 
 import yaml
 
 from core.base import Handler, generate_default_prompt_id
+from core.utils.cache import Cache
 
 from .base import PostgresConnectionManager
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar("T")
-
-
-@dataclass
-class CacheEntry(Generic[T]):
-    """Represents a cached item with metadata."""
-
-    value: T
-    created_at: datetime
-    last_accessed: datetime
-    access_count: int = 0
-
-
-class Cache(Generic[T]):
-    """A generic cache implementation with TTL and LRU-like features."""
-
-    def __init__(
-        self,
-        ttl: Optional[timedelta] = None,
-        max_size: Optional[int] = 1000,
-        cleanup_interval: timedelta = timedelta(hours=1),
-    ):
-        self._cache: dict[str, CacheEntry[T]] = {}
-        self._ttl = ttl
-        self._max_size = max_size
-        self._cleanup_interval = cleanup_interval
-        self._last_cleanup = datetime.now()
-
-    def get(self, key: str) -> Optional[T]:
-        """Retrieve an item from cache."""
-        self._maybe_cleanup()
-
-        if key not in self._cache:
-            return None
-
-        entry = self._cache[key]
-
-        if self._ttl and datetime.now() - entry.created_at > self._ttl:
-            del self._cache[key]
-            return None
-
-        entry.last_accessed = datetime.now()
-        entry.access_count += 1
-        return entry.value
-
-    def set(self, key: str, value: T) -> None:
-        """Store an item in cache."""
-        self._maybe_cleanup()
-
-        now = datetime.now()
-        self._cache[key] = CacheEntry(
-            value=value, created_at=now, last_accessed=now
-        )
-
-        if self._max_size and len(self._cache) > self._max_size:
-            self._evict_lru()
-
-    def invalidate(self, key: str) -> None:
-        """Remove an item from cache."""
-        self._cache.pop(key, None)
-
-    def clear(self) -> None:
-        """Clear all cached items."""
-        self._cache.clear()
-
-    def _maybe_cleanup(self) -> None:
-        """Periodically clean up expired entries."""
-        now = datetime.now()
-        if now - self._last_cleanup > self._cleanup_interval:
-            self._cleanup()
-            self._last_cleanup = now
-
-    def _cleanup(self) -> None:
-        """Remove expired entries."""
-        if not self._ttl:
-            return
-
-        now = datetime.now()
-        expired = [
-            k for k, v in self._cache.items() if now - v.created_at > self._ttl
-        ]
-        for k in expired:
-            del self._cache[k]
-
-    def _evict_lru(self) -> None:
-        """Remove least recently used item."""
-        if not self._cache:
-            return
-
-        lru_key = min(
-            self._cache.keys(), key=lambda k: self._cache[k].last_accessed
-        )
-        del self._cache[lru_key]
-
 
 class CacheablePromptHandler(Handler):
     """Abstract base class that adds caching capabilities to prompt
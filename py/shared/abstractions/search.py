@@ -526,11 +526,13 @@ class SearchSettings(R2RSerializable):
         }
 
     def __init__(self, **data):
-        # Handle legacy search_filters field
-        data["filters"] = {
-            **data.get("filters", {}),
-            **data.get("search_filters", {}),
-        }
+        # Handle legacy search_filters field. Only touch `filters` when one of
+        # them was supplied so it does not show up as explicitly set.
+        if "filters" in data or "search_filters" in data:
+            data["filters"] = {
+                **data.get("filters", {}),
+                **data.get("search_filters", {}),
+            }
         super().__init__(**data)
 
     def model_dump(self, *args, **kwargs):
@@ -577,18 +579,19 @@ def select_search_filters(
     filters = copy(search_settings.filters)
     selected_collections = None
     if not auth_user.is_superuser:
-        user_collections = set(auth_user.collection_ids)
         for key in filters.keys():
             if "collection_ids" in key:
                 selected_collections = set(filters[key]["$overlap"])
                 break
 
+        # Only hash the user's collection ids when there is a selection to
+        # intersect with; UUID hashing dominates the cost of this function.
         if selected_collections:
-            allowed_collections = user_collections.intersection(
-                selected_collections
+            allowed_collections = selected_collections.intersection(
+                auth_user.collection_ids
             )
         else:
-            allowed_collections = user_collections
+            allowed_collections = auth_user.collection_ids
         # for non-superusers, we filter by user_id and selected & allowed collections
         collection_filters = {
             "$or": [
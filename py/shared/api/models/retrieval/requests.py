@@ -0,0 +1,191 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from shared.abstractions import (
+    GenerationConfig,
+    Message,
+    SearchMode,
+    SearchSettings,
+)
+
+SEARCH_MODE_DESCRIPTION = (
+    "Default value of `custom` allows full control over search settings.\n\n"
+    "Pre-configured search modes:\n"
+    "`basic`: A simple semantic-based search.\n"
+    "`advanced`: A more powerful hybrid search combining semantic and full-text.\n"
+    "`custom`: Full control via `search_settings`.\n\n"
+    "If `filters` or `limit` are provided alongside `basic` or `advanced`, "
+    "they will override the default settings for that mode."
+)
+
+SEARCH_SETTINGS_DESCRIPTION = (
+    "The search configuration object. If `search_mode` is `custom`, "
+    "these settings are used as-is. For `basic` or `advanced`, these settings will override the default mode configuration.\n\n"
+    "Common overrides include `filters` to narrow results and `limit` to control how many results are returned."
+)
+
+# Generation configs below use `default_factory` rather than one shared
+# instance: the routes fill in `model` and the LLM providers set `stream` on
+# the object they are handed, and the defaults themselves are only installed
+# from the loaded config (`GenerationConfig.set_default`) after import.
+
+
+class SearchRequest(BaseModel):
+    """Request body for `/retrieval/search`."""
+
+    query: str = Field(
+        ...,
+        min_length=1,
+        description="Search query to find relevant documents",
+    )
+    search_mode: SearchMode = Field(
+        default=SearchMode.custom,
+        description=SEARCH_MODE_DESCRIPTION,
+    )
+    search_settings: Optional[SearchSettings] = Field(
+        None,
+        description=SEARCH_SETTINGS_DESCRIPTION,
+    )
+
+
+class RAGRequest(BaseModel):
+    """Request body for `/retrieval/rag`."""
+
+    query: str = Field(...)
+    search_mode: SearchMode = Field(
+        default=SearchMode.custom,
+        description=SEARCH_MODE_DESCRIPTION,
+    )
+    search_settings: Optional[SearchSettings] = Field(
+        None,
+        description=SEARCH_SETTINGS_DESCRIPTION,
+    )
+    rag_generation_config: GenerationConfig = Field(
+        default_factory=GenerationConfig,
+        description="Configuration for RAG generation",
+    )
+    task_prompt_override: Optional[str] = Field(
+        default=None,
+        description="Optional custom prompt to override default",
+    )
+    include_title_if_available: bool = Field(
+        default=False,
+        description="Include document titles in responses when available",
+    )
+
+
+class AgentRequest(BaseModel):
+    """Request body for `/retrieval/agent`."""
+
+    message: Optional[Message] = Field(
+        default=None,
+        description="Current message to process",
+    )
+    # Flagged in the schema only; `Field(deprecated=...)` would also warn on
+    # every attribute access from the handler.
+    messages: Optional[list[Message]] = Field(
+        default=None,
+        description="List of messages (deprecated, use message instead)",
+        json_schema_extra={"deprecated": True},
+    )
+    search_mode: SearchMode = Field(
+        default=SearchMode.custom,
+        description=SEARCH_MODE_DESCRIPTION,
+    )
+    search_settings: Optional[SearchSettings] = Field(
+        default=None,
+        description=SEARCH_SETTINGS_DESCRIPTION,
+    )
+    rag_generation_config: GenerationConfig = Field(
+        default_factory=GenerationConfig,
+        description="Configuration for RAG generation",
+    )
+    task_prompt_override: Optional[str] = Field(
+        default=None,
+        description="Optional custom prompt to override default",
+    )
+    include_title_if_available: bool = Field(
+        default=True,
+        description="Include document titles in responses when available",
+    )
+    conversation_id: Optional[UUID] = Field(
+        default=None,
+        description="ID of the conversation",
+    )
+    tools: Optional[list[str]] = Field(
+        default=None,
+        description="List of tools to execute",
+    )
+    max_tool_context_length: Optional[int] = Field(
+        default=32_768,
+        description="Maximum length of returned tool context",
+    )
+    use_system_context: Optional[bool] = Field(
+        default=True,
+        description="Use extended prompt for generation",
+    )
+
+
+class ReasoningAgentRequest(BaseModel):
+    """Request body for `/retrieval/reasoning_agent`."""
+
+    message: Optional[Message] = Field(
+        default=None,
+        description="Current message to process",
+    )
+    rag_generation_config: GenerationConfig = Field(
+        default_factory=GenerationConfig,
+        description="Configuration for RAG generation",
+    )
+    conversation_id: Optional[UUID] = Field(
+        default=None,
+        description="ID of the conversation",
+    )
+    tools: Optional[list[str]] = Field(
+        default=None,
+        description="List of tools to execute",
+    )
+    max_tool_context_length: Optional[int] = Field(
+        default=32_768,
+        description="Maximum length of returned tool context",
+    )
+
+
+class CompletionRequest(BaseModel):
+    """Request body for `/retrieval/completion`."""
+
+    messages: list[Message] = Field(
+        ...,
+        description="List of messages to generate completion for",
+        examples=[
+            [
+                {
+                    "role": "system",
+                    "content": "You are a helpful assistant.",
+                },
+                {
+                    "role": "user",
+                    "content": "What is the capital of France?",
+                },
+                {
+                    "role": "assistant",
+                    "content": "The capital of France is Paris.",
+                },
+                {"role": "user", "content": "What about Italy?"},
+            ]
+        ],
+    )
+    generation_config: GenerationConfig = Field(
+        default_factory=GenerationConfig,
+        description="Configuration for text generation",
+        examples=[
+            {
+                "model": "gpt-4o-mini",
+                "temperature": 0.7,
+                "max_tokens": 150,
+                "stream": False,
+            }
+        ],
+    )
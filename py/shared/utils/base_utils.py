@@ -1,4 +1,3 @@
-import json
 import logging
 import math
 import re
@@ -13,6 +12,8 @@ from typing import (
 )
 from uuid import NAMESPACE_DNS, UUID, uuid4, uuid5
 
+from pydantic_core import to_json
+
 from ..abstractions.search import (
     AggregateSearchResult,
     GraphCommunityResult,
@@ -403,47 +404,59 @@ def format_search_results_for_llm(
     return "\n".join(lines)
 
 
-def format_search_results_for_stream(results: AggregateSearchResult) -> str:
-    CHUNK_SEARCH_STREAM_MARKER = "chunk_search"
-    GRAPH_SEARCH_STREAM_MARKER = "graph_search"
-    WEB_SEARCH_STREAM_MARKER = "web_search"
-    CONTEXT_STREAM_MARKER = "content"
+def _dumps_for_stream(value: Any) -> str:
+    # pydantic-core's encoder is several times faster than json.dumps on
+    # these result lists. UUIDs and Decimals come out as the same strings,
+    # datetimes as ISO 8601 ("T" separator) rather than str(), and anything
+    # it cannot encode natively falls back to str().
+    return to_json(value, fallback=str).decode()
 
-    context = ""
+
+def format_search_results_for_stream(results: AggregateSearchResult) -> str:
+    # The markers are plain literals and the sections are joined once at the
+    # end, rather than formatting each tag and re-copying the (potentially
+    # large) payload on every `+=`.
+    parts: list[str] = []
 
     if results.chunk_search_results:
-        context += f"<{CHUNK_SEARCH_STREAM_MARKER}>"
-        vector_results_list = [
-            r.as_dict() for r in results.chunk_search_results
-        ]
-        context += json.dumps(vector_results_list, default=str)
-        context += f"</{CHUNK_SEARCH_STREAM_MARKER}>"
+        parts += (
+            "<chunk_search>",
+            _dumps_for_stream(
+                [r.as_dict() for r in results.chunk_search_results]
+            ),
+            "</chunk_search>",
+        )
 
     if results.graph_search_results:
-        context += f"<{GRAPH_SEARCH_STREAM_MARKER}>"
-        graph_search_results_results_list = [
-            r.dict() for r in results.graph_search_results
-        ]
-        context += json.dumps(graph_search_results_results_list, default=str)
-        context += f"</{GRAPH_SEARCH_STREAM_MARKER}>"
+        parts += (
+            "<graph_search>",
+            _dumps_for_stream(
+                [r.model_dump() for r in results.graph_search_results]
+            ),
+            "</graph_search>",
+        )
 
     if results.web_search_results:
-        context += f"<{WEB_SEARCH_STREAM_MARKER}>"
-        web_results_list = [r.to_dict() for r in results.web_search_results]
-        context += json.dumps(web_results_list, default=str)
-        context += f"</{WEB_SEARCH_STREAM_MARKER}>"
+        parts += (
+            "<web_search>",
+            _dumps_for_stream(
+                [r.to_dict() for r in results.web_search_results]
+            ),
+            "</web_search>",
+        )
 
     # NEW: local context
+    # Just store them as raw dict JSON, or build a more structured form
     if results.context_document_results:
-        context += f"<{CONTEXT_STREAM_MARKER}>"
-        # Just store them as raw dict JSON, or build a more structured form
-        content_list = [
-            cdr.to_dict() for cdr in results.context_document_results
-        ]
-        context += json.dumps(content_list, default=str)
-        context += f"</{CONTEXT_STREAM_MARKER}>"
-
-    return context
+        parts += (
+            "<content>",
+            _dumps_for_stream(
+                [cdr.to_dict() for cdr in results.context_document_results]
+            ),
+            "</content>",
+        )
+
+    return "".join(parts)
 
 
 def _generate_id_from_label(label) -> UUID:
@@ -0,0 +1,212 @@
+from datetime import datetime, timezone
+from typing import Optional
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from core.base import AppConfig, AuthConfig
+from core.main.api.v3.base_router import BaseRouterV3, R2RJSONResponse
+from core.providers import R2RAuthProvider
+from shared.api.models.base import R2RResults
+
+
+class Item(BaseModel):
+    id: UUID
+    name: str
+    score: float
+    created_at: datetime
+    note: Optional[str] = None
+
+
+ITEM = Item(
+    id=UUID(int=1),
+    name="Aristotle é",
+    score=0.1,
+    created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+)
+
+
+def _client(response_class):
+
+    class Router(BaseRouterV3):
+        default_response_class = response_class
+
+        def _setup_routes(self):
+
+            @self.router.get("/item")
+            @self.base_endpoint
+            async def item() -> R2RResults[Item]:
+                return ITEM  # type: ignore
+
+    router = Router(Mock(), Mock(), Mock())
+    app = FastAPI()
+    app.include_router(router.get_router())
+    return TestClient(app)
+
+
+@pytest.fixture
+def client():
+    return _client(R2RJSONResponse)
+
+
+def test_model_responses_render_the_same_bytes_as_json_response(client):
+    response = client.get("/item")
+    baseline = _client(JSONResponse).get("/item")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == baseline.content
+    assert response.json() == {
+        "results": {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "name": "Aristotle é",
+            "score": 0.1,
+            "created_at": "2024-01-02T03:04:05Z",
+            "note": None,
+        }
+    }
+
+
+def _passthrough_client(response):
+
+    class Router(BaseRouterV3):
+        default_response_class = R2RJSONResponse
+
+        def _setup_routes(self):
+
+            @self.router.get("/response")
+            @self.base_endpoint
+            async def prebuilt() -> R2RResults[Item]:
+                return response  # type: ignore
+
+    router = Router(Mock(), Mock(), Mock())
+    app = FastAPI()
+    app.include_router(router.get_router())
+    return TestClient(app)
+
+
+def test_returned_response_passes_through_untouched():
+    response = _passthrough_client(
+        Response(b"raw body", media_type="text/plain",
+                 headers={"X-Test": "1"})).get("/response")
+
+    assert response.content == b"raw body"
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.headers["x-test"] == "1"
+
+
+def test_prerendered_model_response_matches_returning_the_model(client):
+    prerendered = _passthrough_client(
+        R2RJSONResponse(R2RResults[Item](results=ITEM))).get("/response")
+
+    assert prerendered.content == client.get("/item").content
+
+
+###############################################################################
+# auth wrapper
+###############################################################################
+
+
+@pytest.fixture
+def auth_provider():
+    database = Mock()
+    database.users_handler.get_user_by_email = AsyncMock(
+        return_value=Mock(is_superuser=True))
+    return R2RAuthProvider(AuthConfig(provider="r2r", app=AppConfig()), Mock(), database,
+                           Mock())
+
+
+def test_auth_wrapper_is_reused_per_public_flag(auth_provider):
+    private = auth_provider.auth_wrapper()
+    public = auth_provider.auth_wrapper(public=True)
+
+    assert auth_provider.auth_wrapper() is private
+    assert auth_provider.auth_wrapper(public=False) is private
+    assert auth_provider.auth_wrapper(public=True) is public
+    assert public is not private
+
+
+def test_rate_limiter_and_endpoint_share_one_authentication(auth_provider):
+    providers = Mock()
+    providers.auth = auth_provider
+
+    class Router(BaseRouterV3):
+
+        def _setup_routes(self):
+
+            @self.router.get(
+                "/me", dependencies=[Depends(self.rate_limit_dependency)])
+            async def me(auth_user=Depends(
+                    self.providers.auth.auth_wrapper())) -> dict:
+                return {}
+
+    app = FastAPI()
+    app.include_router(Router(providers, Mock(), Mock()).get_router())
+    client = TestClient(app)
+    get_user = auth_provider.database_provider.users_handler.get_user_by_email
+
+    for requests in (1, 2):
+        assert client.get("/me").status_code == 200
+        assert get_user.await_count == requests
+
+
+###############################################################################
+# rate limiting
+###############################################################################
+
+
+@pytest.fixture
+def user():
+    return Mock(is_superuser=False, id=uuid4())
+
+
+@pytest.fixture
+def limits(user):
+    providers = Mock()
+
+    async def auth_user():
+        return user
+
+    providers.auth.auth_wrapper.return_value = auth_user
+    providers.database.limits_handler.check_limits = AsyncMock()
+    providers.database.limits_handler.log_request = AsyncMock()
+
+    class Router(BaseRouterV3):
+
+        def _setup_routes(self):
+
+            @self.router.post(
+                "/limited", dependencies=[Depends(self.rate_limit_dependency)])
+            async def limited() -> dict:
+                return {}
+
+    app = FastAPI()
+    app.include_router(Router(providers, Mock(), Mock()).get_router())
+    return TestClient(app), providers.database.limits_handler
+
+
+def test_rate_limit_checks_and_logs_the_authenticated_user(limits, user):
+    client, handler = limits
+    assert client.post("/limited").status_code == 200
+    handler.check_limits.assert_awaited_once_with(user=user, route="/limited")
+    handler.log_request.assert_awaited_once_with(user.id, "/limited")
+
+
+def test_rate_limit_breach_is_too_many_requests(limits):
+    client, handler = limits
+    handler.check_limits.side_effect = ValueError("Monthly limit exceeded")
+    response = client.post("/limited")
+    assert response.status_code == 429
+    handler.log_request.assert_not_awaited()
+
+
+def test_rate_limit_skips_superusers(limits, user):
+    client, handler = limits
+    user.is_superuser = True
+    assert client.post("/limited").status_code == 200
+    handler.check_limits.assert_not_awaited()
+    handler.log_request.assert_not_awaited()
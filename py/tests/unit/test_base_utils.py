@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from core.base import (
+    AggregateSearchResult,
+    ChunkSearchResult,
+    format_search_results_for_stream,
+)
+
+
+def test_stream_search_results_encoding():
+    """Pins the JSON emitted inside the streamed search-results block.
+
+    The block is compact UTF-8 JSON. UUIDs and Decimals are strings, and
+    datetimes are ISO 8601 (`2024-01-02T03:04:05Z`), not `str()` output.
+    """
+    chunk = ChunkSearchResult(
+        id=UUID(int=1),
+        document_id=UUID(int=2),
+        owner_id=None,
+        collection_ids=[UUID(int=3)],
+        score=0.5,
+        text="Aristotle é",
+        metadata={
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "price": Decimal("1.50"),
+        },
+    )
+
+    block = format_search_results_for_stream(
+        AggregateSearchResult(chunk_search_results=[chunk]))
+
+    assert block == (
+        "<chunk_search>"
+        '[{"id":"00000000-0000-0000-0000-000000000001",'
+        '"document_id":"00000000-0000-0000-0000-000000000002",'
+        '"owner_id":null,'
+        '"collection_ids":["00000000-0000-0000-0000-000000000003"],'
+        '"score":0.5,'
+        '"text":"Aristotle é",'
+        '"metadata":{"created_at":"2024-01-02T03:04:05Z","price":"1.50"}}]'
+        "</chunk_search>")
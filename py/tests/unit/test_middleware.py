@@ -0,0 +1,40 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from core.main.middleware import EventStreamAwareGZipMiddleware
+
+PAYLOAD = "chunk text " * 500
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(EventStreamAwareGZipMiddleware, minimum_size=1024)
+
+    @app.get("/json")
+    async def json_response():
+        return JSONResponse({"results": PAYLOAD})
+
+    @app.get("/stream")
+    async def stream_response():
+        async def events():
+            for _ in range(3):
+                yield PAYLOAD
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def test_large_json_response_is_gzipped(client):
+    response = client.get("/json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"results": PAYLOAD}
+
+
+def test_event_stream_is_not_compressed(client):
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == PAYLOAD * 3
@@ -0,0 +1,167 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from core.base import AggregateSearchResult, R2RException, SearchMode
+from core.base.api.models import AgentRequest
+from core.main.api.v3.retrieval_router import RetrievalRouter
+from core.main.services.retrieval_service import RetrievalService
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry(monkeypatch):
+    monkeypatch.setattr(
+        "core.telemetry.telemetry_decorator.telemetry_thread_pool", None)
+
+
+@pytest.fixture
+def providers():
+    providers = Mock()
+    user = Mock(is_superuser=False, id=uuid4(), collection_ids=[])
+
+    async def auth_user():
+        return user
+
+    providers.auth.auth_wrapper.return_value = auth_user
+    providers.database.limits_handler.check_limits = AsyncMock()
+    providers.database.limits_handler.log_request = AsyncMock()
+    return providers
+
+
+@pytest.fixture
+def services(providers):
+    services = Mock()
+    services.retrieval = RetrievalService(config=Mock(), providers=providers)
+    return services
+
+
+@pytest.fixture
+def client(providers, services):
+    config = Mock()
+    config.app.stream_flush_bytes = 4096
+    config.app.stream_flush_interval_ms = 20
+    config.app.stream_prefetch_chunks = 0
+    router = RetrievalRouter(providers, services, config)
+
+    app = FastAPI()
+
+    @app.exception_handler(R2RException)
+    async def r2r_exception_handler(request: Request, exc: R2RException):
+        return JSONResponse(status_code=exc.status_code,
+                            content={"message": exc.message})
+
+    app.include_router(router.get_router())
+    return TestClient(app)
+
+
+def test_agent_without_message_is_a_bad_request(client):
+    response = client.post("/retrieval/agent", json={})
+    assert response.status_code == 400
+    assert response.json() == {
+        "message": "Either message or messages should be provided"
+    }
+
+
+def test_agent_with_message_and_messages_is_a_bad_request(client):
+    message = {"role": "user", "content": "hi"}
+    response = client.post("/retrieval/agent",
+                           json={
+                               "message": message,
+                               "messages": [message]
+                           })
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path",
+                         ["/retrieval/agent", "/retrieval/reasoning_agent"])
+def test_agent_routes_accept_an_empty_body(client, services, path):
+    services.retrieval.agent = AsyncMock(
+        side_effect=R2RException("rejected by the service", 400))
+    response = client.post(path)
+    assert response.status_code == 400
+    services.retrieval.agent.assert_awaited_once()
+
+
+@pytest.fixture
+def search(services):
+    services.retrieval.search = AsyncMock(
+        return_value=AggregateSearchResult().as_dict())
+    return services.retrieval.search
+
+
+def test_empty_search_query_is_rejected(client, search):
+    response = client.post("/retrieval/search", json={"query": ""})
+    assert response.status_code == 422
+    (error, ) = response.json()["detail"]
+    assert error["loc"] == ["body", "query"]
+    assert error["type"] == "string_too_short"
+    search.assert_not_awaited()
+
+
+def test_search_query_is_passed_to_the_service(client, search):
+    response = client.post("/retrieval/search", json={"query": "q"})
+    assert response.status_code == 200
+    assert search.await_args.kwargs["query"] == "q"
+
+
+@pytest.mark.parametrize("path", ["/retrieval/search", "/retrieval/rag"])
+def test_query_is_required(client, path):
+    response = client.post(path, json={})
+    assert response.status_code == 422
+    (error, ) = response.json()["detail"]
+    assert error["loc"] == ["body", "query"]
+    assert error["type"] == "missing"
+
+
+def test_agent_request_defaults():
+    request = AgentRequest()
+    assert request.model_fields_set == set()
+    assert request.search_mode is SearchMode.custom
+    assert request.include_title_if_available is True
+    assert request.max_tool_context_length == 32_768
+    assert request.use_system_context is True
+    # Each request gets its own generation config to fill in.
+    assert (request.rag_generation_config
+            is not AgentRequest().rag_generation_config)
+
+
+def test_agent_body_fields_reach_the_service(client, services):
+    conversation_id = uuid4()
+    services.retrieval.agent = AsyncMock(return_value={
+        "messages": [],
+        "conversation_id": str(conversation_id)
+    })
+    response = client.post(
+        "/retrieval/agent",
+        json={
+            "message": {
+                "role": "user",
+                "content": "hi"
+            },
+            "conversation_id": str(conversation_id),
+            "search_mode": "basic",
+            "search_settings": {
+                "limit": 3
+            },
+            "tools": ["local_search"],
+        },
+    )
+    assert response.status_code == 200
+    kwargs = services.retrieval.agent.await_args.kwargs
+    assert kwargs["message"].content == "hi"
+    assert kwargs["conversation_id"] == conversation_id
+    assert kwargs["search_settings"].limit == 3
+    assert kwargs["override_tools"] == ["local_search"]
+    assert kwargs["max_tool_context_length"] == 32_768
+
+
+def test_completion_requires_messages(client):
+    response = client.post("/retrieval/completion", json={})
+    assert response.status_code == 422
+    (error, ) = response.json()["detail"]
+    assert error["loc"] == ["body", "messages"]
+    assert error["type"] == "missing"
@@ -0,0 +1,206 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.base import GenerationConfig, Message, R2RException, SearchSettings
+from core.main.services.retrieval_service import RetrievalService
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry(monkeypatch):
+    monkeypatch.setattr(
+        "core.telemetry.telemetry_decorator.telemetry_thread_pool", None)
+
+
+@pytest.fixture
+def service():
+    return RetrievalService(config=Mock(), providers=Mock())
+
+
+###############################################################################
+# search single-flight
+###############################################################################
+
+
+@pytest.fixture
+def gated_search(service):
+    """Replace the search itself with one that blocks until released."""
+    release = asyncio.Event()
+    calls = []
+    outcome = {"error": None}
+
+    async def _search(query, search_settings):
+        calls.append(query)
+        await release.wait()
+        if outcome["error"] is not None:
+            raise outcome["error"]
+        return {"chunk_search_results": [{"text": query}]}
+
+    service._search = _search
+    return release, calls, outcome
+
+
+async def _search_concurrently(service, release, *queries, settings=None):
+    # Each caller builds its own settings, as separate requests do.
+    settings = settings or [SearchSettings() for _ in queries]
+    tasks = [
+        asyncio.ensure_future(service.search(query, query_settings))
+        for query, query_settings in zip(queries, settings, strict=True)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def test_concurrent_identical_searches_share_one_call(
+        service, gated_search):
+    release, calls, _ = gated_search
+    results = await _search_concurrently(service, release, "q", "q", "q")
+    assert calls == ["q"]
+    assert all(result == results[0] for result in results)
+
+
+async def test_different_searches_are_not_shared(service, gated_search):
+    release, calls, _ = gated_search
+    await _search_concurrently(service, release, "q1", "q2")
+    assert sorted(calls) == ["q1", "q2"]
+
+
+async def test_same_query_with_different_settings_is_not_shared(
+        service, gated_search):
+    release, calls, _ = gated_search
+    await _search_concurrently(
+        service,
+        release,
+        "q",
+        "q",
+        settings=[SearchSettings(limit=5),
+                  SearchSettings(limit=6)],
+    )
+    assert calls == ["q", "q"]
+
+
+async def test_shared_search_results_are_independent_copies(
+        service, gated_search):
+    release, _, _ = gated_search
+    results = await _search_concurrently(service, release, "q", "q", "q")
+    # The first caller started the search and gets a copy as well.
+    assert len({id(result) for result in results}) == 3
+    results[0]["chunk_search_results"].append({"text": "extra"})
+    results[1]["chunk_search_results"][0]["text"] = "changed"
+    assert results[2] == {"chunk_search_results": [{"text": "q"}]}
+
+
+async def test_shared_search_failure_reaches_every_caller(
+        service, gated_search):
+    release, calls, outcome = gated_search
+    outcome["error"] = R2RException("search failed", 400)
+    results = await _search_concurrently(service, release, "q", "q", "q")
+    assert calls == ["q"]
+    assert all(isinstance(result, R2RException) for result in results)
+
+
+async def test_search_runs_again_once_previous_call_finished(
+        service, gated_search):
+    release, calls, _ = gated_search
+    release.set()
+    await service.search("q", SearchSettings())
+    await service.search("q", SearchSettings())
+    assert calls == ["q", "q"]
+
+
+###############################################################################
+# embedding and completion caches
+###############################################################################
+
+
+def _age_entries(cache, by):
+    for entry in cache._cache.values():
+        entry.created_at -= by
+
+
+@pytest.fixture
+def embedder(service):
+    provider = service.providers.completion_embedding
+    provider.config.base_model = "test-embedding-model"
+    provider.async_get_embedding = AsyncMock(return_value=[0.1, 0.2])
+    return provider.async_get_embedding
+
+
+async def test_repeated_embedding_is_served_from_cache(service, embedder):
+    assert await service.embedding("text") == [0.1, 0.2]
+    assert await service.embedding("text") == [0.1, 0.2]
+    assert embedder.await_count == 1
+
+
+async def test_embedding_cache_entries_expire_after_ttl(service, embedder):
+    await service.embedding("text")
+    _age_entries(service._embedding_cache, timedelta(hours=24, seconds=1))
+    await service.embedding("text")
+    assert embedder.await_count == 2
+
+
+async def test_embedding_cache_evicts_beyond_max_size(service, embedder):
+    for i in range(2048 + 1):
+        await service.embedding(f"text {i}")
+    assert len(service._embedding_cache._cache) == 2048
+    await service.embedding("text 0")
+    assert embedder.await_count == 2048 + 2
+
+
+@pytest.fixture
+def llm(service):
+    service.providers.llm.aget_completion = AsyncMock(
+        return_value={"choices": []})
+    return service.providers.llm.aget_completion
+
+
+MESSAGES = [Message(role="user", content="What is the capital of France?")]
+
+
+async def test_deterministic_completion_is_served_from_cache(service, llm):
+    config = GenerationConfig(model="m", temperature=0, stream=False)
+    await service.completion(MESSAGES, config)
+    await service.completion(MESSAGES, config)
+    assert llm.await_count == 1
+
+
+@pytest.mark.parametrize(
+    "config, args, kwargs",
+    [
+        (GenerationConfig(model="m", temperature=0.5, stream=False), (), {}),
+        (GenerationConfig(model="m", temperature=0, stream=True), (), {}),
+        (GenerationConfig(model="m", temperature=0, stream=False),
+         ("extra", ), {}),
+        (GenerationConfig(model="m", temperature=0, stream=False), (), {
+            "extra": 1
+        }),
+    ],
+    ids=["temperature", "stream", "args", "kwargs"],
+)
+async def test_non_deterministic_completion_is_not_cached(
+        service, llm, config, args, kwargs):
+    await service.completion(MESSAGES, config, *args, **kwargs)
+    await service.completion(MESSAGES, config, *args, **kwargs)
+    assert llm.await_count == 2
+    assert not service._completion_cache._cache
+
+
+async def test_completion_cache_entries_expire_after_ttl(service, llm):
+    config = GenerationConfig(model="m", temperature=0, stream=False)
+    await service.completion(MESSAGES, config)
+    _age_entries(service._completion_cache, timedelta(hours=1, seconds=1))
+    await service.completion(MESSAGES, config)
+    assert llm.await_count == 2
+
+
+async def test_completion_cache_evicts_beyond_max_size(service, llm):
+    config = GenerationConfig(model="m", temperature=0, stream=False)
+    for i in range(1024 + 1):
+        await service.completion([Message(role="user", content=str(i))],
+                                 config)
+    assert len(service._completion_cache._cache) == 1024
+    await service.completion([Message(role="user", content="0")], config)
+    assert llm.await_count == 1024 + 2
@@ -0,0 +1,182 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from core.base import SearchMode, SearchSettings, select_search_filters
+from core.main.api.v3.retrieval_router import (
+    _DEFAULT_SEARCH_SETTINGS,
+    RetrievalRouter,
+    merge_search_settings,
+)
+
+
+@pytest.fixture
+def user():
+    return Mock(is_superuser=False, id=uuid4(), collection_ids=[uuid4()])
+
+
+###############################################################################
+# merge_search_settings
+###############################################################################
+
+
+def test_merge_returns_base_when_no_fields_set():
+    base = _DEFAULT_SEARCH_SETTINGS[SearchMode.advanced].model_copy()
+    assert merge_search_settings(base, SearchSettings()) is base
+
+
+def test_merge_applies_only_explicitly_set_fields():
+    base = _DEFAULT_SEARCH_SETTINGS[SearchMode.advanced].model_copy()
+    overrides = SearchSettings(limit=5,
+                               filters={"document_id": {
+                                   "$eq": "doc"
+                               }})
+
+    merged = merge_search_settings(base, overrides)
+
+    assert merged.limit == 5
+    assert merged.filters == {"document_id": {"$eq": "doc"}}
+    # Fields left at their defaults on overrides keep the mode's values.
+    assert merged.use_fulltext_search is True
+    assert merged.use_hybrid_search is True
+    assert merged.search_strategy == "hyde"
+    assert {"limit", "filters"} <= merged.model_fields_set
+
+
+def test_merge_applies_explicit_values_equal_to_defaults():
+    base = _DEFAULT_SEARCH_SETTINGS[SearchMode.advanced].model_copy()
+    overrides = SearchSettings(use_hybrid_search=False)
+
+    merged = merge_search_settings(base, overrides)
+
+    assert merged.use_hybrid_search is False
+
+
+def test_mode_defaults_are_not_mutated_across_requests(user):
+    before = {
+        mode: settings.model_dump()
+        for mode, settings in _DEFAULT_SEARCH_SETTINGS.items()
+    }
+
+    for mode in (SearchMode.basic, SearchMode.advanced):
+        first = RetrievalRouter._prepare_search_settings(
+            Mock(),
+            user,
+            mode,
+            SearchSettings(
+                limit=3,
+                filters={"document_id": {
+                    "$eq": "doc"
+                }},
+                chunk_settings={"index_measure": "l2_distance"},
+            ),
+        )
+        first.filters["extra"] = {"$eq": 1}
+        second = RetrievalRouter._prepare_search_settings(
+            Mock(), user, mode, None)
+
+        assert second is not _DEFAULT_SEARCH_SETTINGS[mode]
+        assert second.limit == before[mode]["limit"]
+        assert "extra" not in str(second.filters)
+        assert second.chunk_settings.index_measure == (
+            before[mode]["chunk_settings"]["index_measure"])
+
+    after = {
+        mode: settings.model_dump()
+        for mode, settings in _DEFAULT_SEARCH_SETTINGS.items()
+    }
+    assert after == before
+
+
+###############################################################################
+# SearchSettings filters / select_search_filters
+###############################################################################
+
+
+def test_filters_not_injected_when_not_supplied():
+    settings = SearchSettings(limit=5)
+    assert "filters" not in settings.model_fields_set
+    assert settings.filters == {}
+
+
+def test_filters_injected_when_filters_supplied():
+    settings = SearchSettings(filters={"document_id": {"$eq": "doc"}})
+    assert "filters" in settings.model_fields_set
+    assert settings.filters == {"document_id": {"$eq": "doc"}}
+
+
+def test_legacy_search_filters_are_merged_into_filters():
+    settings = SearchSettings(
+        filters={"document_id": {
+            "$eq": "doc"
+        }},
+        search_filters={"category": {
+            "$eq": "news"
+        }},
+    )
+    assert "filters" in settings.model_fields_set
+    assert settings.filters == {
+        "document_id": {
+            "$eq": "doc"
+        },
+        "category": {
+            "$eq": "news"
+        },
+    }
+
+    settings = SearchSettings(search_filters={"category": {"$eq": "news"}})
+    assert "filters" in settings.model_fields_set
+    assert settings.filters == {"category": {"$eq": "news"}}
+
+
+def test_select_search_filters_without_selection(user):
+    user.collection_ids = [uuid4(), uuid4()]
+    settings = SearchSettings(filters={"document_id": {"$eq": "doc"}})
+
+    filters = select_search_filters(user, settings)
+
+    collection_filters, user_filters = filters["$and"]
+    owner, collections = collection_filters["$or"]
+    assert owner == {"owner_id": {"$eq": user.id}}
+    assert set(collections["collection_ids"]["$overlap"]) == set(
+        user.collection_ids)
+    assert user_filters == {"document_id": {"$eq": "doc"}}
+    # The settings' own filters are left as they were.
+    assert settings.filters == {"document_id": {"$eq": "doc"}}
+
+
+def test_select_search_filters_without_any_filters(user):
+    filters = select_search_filters(user, SearchSettings())
+    assert filters == {
+        "$or": [
+            {
+                "owner_id": {
+                    "$eq": user.id
+                }
+            },
+            {
+                "collection_ids": {
+                    "$overlap": list(user.collection_ids)
+                }
+            },
+        ]
+    }
+
+
+def test_select_search_filters_intersects_selected_collections(user):
+    allowed, other = user.collection_ids[0], uuid4()
+    settings = SearchSettings(
+        filters={"collection_ids": {
+            "$overlap": [allowed, other]
+        }})
+
+    filters = select_search_filters(user, settings)
+
+    assert filters["$or"][1] == {"collection_ids": {"$overlap": [allowed]}}
+
+
+def test_select_search_filters_leaves_superuser_filters(user):
+    user.is_superuser = True
+    settings = SearchSettings(filters={"document_id": {"$eq": "doc"}})
+    assert select_search_filters(user, settings) == settings.filters
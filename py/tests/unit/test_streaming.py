@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+
+from core.main.api.v3.base_router import R2RStreamingResponse
+from core.main.api.v3.retrieval_router import coalesce_stream, prefetch_stream
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+async def _chunks(*chunks, delay=0.0):
+    for chunk in chunks:
+        if delay:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+###############################################################################
+# coalesce_stream
+###############################################################################
+
+
+async def test_coalesce_flushes_when_size_reached():
+    out = await _collect(
+        coalesce_stream(_chunks("aa", "bb", "cc"), flush_bytes=4,
+                        flush_interval=10)
+    )
+    assert out == [b"aabb", b"cc"]
+
+
+async def test_coalesce_flushes_after_interval():
+    out = await _collect(
+        coalesce_stream(_chunks("a", "b", delay=0.05), flush_bytes=1024,
+                        flush_interval=0.01)
+    )
+    assert out == [b"a", b"b"]
+
+
+async def test_coalesce_flushes_remainder_at_end_of_stream():
+    out = await _collect(
+        coalesce_stream(_chunks("a", "b", "c"), flush_bytes=1024,
+                        flush_interval=10)
+    )
+    assert out == [b"abc"]
+
+
+async def test_coalesce_reads_directly_when_nothing_is_buffered():
+    tasks = []
+
+    async def upstream():
+        tasks.append(asyncio.current_task())
+        yield "a"
+
+    consumer = asyncio.current_task()
+    out = await _collect(
+        coalesce_stream(upstream(), flush_bytes=1, flush_interval=10))
+    assert out == [b"a"]
+    # The read ran in the consumer's task rather than a task of its own.
+    assert tasks == [consumer]
+
+
+async def _failing_upstream():
+    yield "t0;"
+    yield "t1;"
+    yield "t2;"
+    raise RuntimeError("upstream failed")
+
+
+async def test_coalesce_flushes_buffer_before_upstream_error():
+    received = []
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        async for chunk in coalesce_stream(
+            _failing_upstream(), flush_bytes=1024, flush_interval=10
+        ):
+            received.append(chunk)
+    assert b"".join(received) == b"t0;t1;t2;"
+
+
+async def test_coalesce_flushes_buffer_before_error_through_prefetch():
+    received = []
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        async for chunk in coalesce_stream(
+            prefetch_stream(_failing_upstream(), maxsize=4),
+            flush_bytes=1024,
+            flush_interval=10,
+        ):
+            received.append(chunk)
+    assert b"".join(received) == b"t0;t1;t2;"
+
+
+###############################################################################
+# prefetch_stream
+###############################################################################
+
+
+async def test_prefetch_stops_reading_ahead_at_maxsize():
+    produced = 0
+
+    async def upstream():
+        nonlocal produced
+        while True:
+            produced += 1
+            yield produced
+
+    stream = prefetch_stream(upstream(), maxsize=2)
+    assert await stream.__anext__() == 1
+    # Give the producer every chance to run ahead.
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # The queue holds `maxsize` chunks and the producer blocks on one more.
+    assert produced == 1 + 2 + 1
+    await stream.aclose()
+
+
+async def test_prefetch_passes_upstream_error_after_chunks():
+    received = []
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        async for chunk in prefetch_stream(_failing_upstream(), maxsize=8):
+            received.append(chunk)
+    assert received == ["t0;", "t1;", "t2;"]
+
+
+async def test_prefetch_closes_upstream_when_consumer_stops():
+    closed = asyncio.Event()
+
+    async def upstream():
+        try:
+            while True:
+                yield "x"
+        finally:
+            closed.set()
+
+    stream = prefetch_stream(upstream(), maxsize=2)
+    async for _ in stream:
+        break
+    await stream.aclose()
+    assert closed.is_set()
+
+
+###############################################################################
+# R2RStreamingResponse
+###############################################################################
+
+
+async def test_streaming_response_closes_body_on_client_disconnect():
+    sending = asyncio.Event()
+    closed = asyncio.Event()
+
+    async def body():
+        try:
+            while True:
+                yield b"x"
+        finally:
+            closed.set()
+
+    async def receive():
+        await sending.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        # The disconnect cancels the response while a body chunk is being
+        # sent, with the body generator suspended at its yield.
+        if message["type"] == "http.response.body":
+            sending.set()
+            await asyncio.sleep(0.01)
+
+    response = R2RStreamingResponse(body(), media_type="text/event-stream")
+    await response({"type": "http"}, receive, send)
+    assert closed.is_set()